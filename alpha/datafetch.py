@@ -7,7 +7,8 @@ Provides modular, reusable functions with error handling for external API calls.
 """
 
 import logging
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, Optional, Tuple
 import time
 
 # Configure logging
@@ -88,6 +89,49 @@ def get_stock_price(symbol: str) -> float:
         raise DataFetchError(error_msg)
 
 
+def _normalize_crypto_symbol(symbol: str) -> str:
+    """Return a symbol as a ccxt trading pair (e.g. 'btc-usd' -> 'BTC/USD', 'ETH' -> 'ETH/USDT')."""
+    symbol = symbol.upper().strip()
+    
+    # Normalize symbol format for ccxt
+    if '-' in symbol:
+        symbol = symbol.replace('-', '/')
+    
+    # Add /USDT if no pair specified
+    if '/' not in symbol:
+        symbol = f"{symbol}/USDT"
+    
+    return symbol
+
+
+def _create_exchange(exchange: str):
+    """
+    Create a ccxt exchange instance by (lower-case) name.
+    
+    Raises:
+        ImportError: If ccxt is not installed
+        DataFetchError: If the exchange is not supported
+    """
+    import ccxt
+    
+    config = {
+        'sandbox': False,
+        'enableRateLimit': True,
+    }
+    
+    if exchange == 'binance':
+        return ccxt.binance(config)
+    if exchange == 'coinbase':
+        return ccxt.coinbasepro(config)
+    if exchange == 'kraken':
+        return ccxt.kraken(config)
+    
+    # Try to dynamically create exchange
+    if hasattr(ccxt, exchange):
+        return getattr(ccxt, exchange)(config)
+    raise DataFetchError(f"Unsupported exchange: {exchange}")
+
+
 def get_crypto_price(symbol: str, exchange: str = "binance") -> float:
     """
     Fetch the current cryptocurrency price using ccxt.
@@ -108,46 +152,11 @@ def get_crypto_price(symbol: str, exchange: str = "binance") -> float:
     if not exchange or not isinstance(exchange, str):
         raise DataFetchError("Exchange must be a non-empty string")
     
-    symbol = symbol.upper().strip()
+    symbol = _normalize_crypto_symbol(symbol)
     exchange = exchange.lower().strip()
     
-    # Normalize symbol format for ccxt
-    if '-' in symbol:
-        symbol = symbol.replace('-', '/')
-    
-    # Add /USDT if no pair specified
-    if '/' not in symbol:
-        symbol = f"{symbol}/USDT"
-    
     try:
-        import ccxt
-        
-        # Create exchange instance
-        if exchange == 'binance':
-            exchange_obj = ccxt.binance({
-                'sandbox': False,
-                'enableRateLimit': True,
-            })
-        elif exchange == 'coinbase':
-            exchange_obj = ccxt.coinbasepro({
-                'sandbox': False,
-                'enableRateLimit': True,
-            })
-        elif exchange == 'kraken':
-            exchange_obj = ccxt.kraken({
-                'sandbox': False,
-                'enableRateLimit': True,
-            })
-        else:
-            # Try to dynamically create exchange
-            if hasattr(ccxt, exchange):
-                exchange_class = getattr(ccxt, exchange)
-                exchange_obj = exchange_class({
-                    'sandbox': False,
-                    'enableRateLimit': True,
-                })
-            else:
-                raise DataFetchError(f"Unsupported exchange: {exchange}")
+        exchange_obj = _create_exchange(exchange)
         
         # Fetch ticker
         ticker = exchange_obj.fetch_ticker(symbol)
@@ -207,6 +216,101 @@ def get_market_price(symbol: str, asset_type: str, exchange: str = "binance") ->
         raise DataFetchError(f"Failed to fetch price for {symbol} ({asset_type}): {str(e)}")
 
 
+def get_crypto_prices(symbols: Iterable[str], exchange: str = "binance") -> Dict[str, float]:
+    """
+    Fetch current prices for several cryptocurrencies in one exchange request.
+    
+    Args:
+        symbols: Crypto symbols or trading pairs (e.g. 'BTC', 'ETH/USDT')
+        exchange (str): Exchange name (default: 'binance')
+        
+    Returns:
+        dict: Price by symbol as given; symbols without a valid price are omitted
+        
+    Raises:
+        DataFetchError: If the batch request itself fails
+    """
+    pairs = {symbol: _normalize_crypto_symbol(symbol) for symbol in symbols}
+    if not pairs:
+        return {}
+    
+    exchange = exchange.lower().strip()
+    
+    try:
+        exchange_obj = _create_exchange(exchange)
+        tickers = exchange_obj.fetch_tickers(sorted(set(pairs.values())))
+    except ImportError:
+        raise DataFetchError("ccxt library not available. Please install with: pip install ccxt")
+    except Exception as e:
+        raise DataFetchError(f"Failed to fetch crypto prices on {exchange}: {str(e)}")
+    
+    prices = {}
+    for symbol, pair in pairs.items():
+        last = (tickers.get(pair) or {}).get('last')
+        if last is not None and float(last) > 0:
+            prices[symbol] = float(last)
+    
+    logger.info(f"Fetched {len(prices)}/{len(pairs)} crypto prices from {exchange} in one request")
+    return prices
+
+
+def get_market_prices(assets: Iterable[Tuple[str, str]], exchange: str = "binance",
+                      max_workers: int = 8) -> Tuple[Dict[Tuple[str, str], float], Dict[Tuple[str, str], str]]:
+    """
+    Fetch current prices for many (symbol, asset_type) pairs at once.
+    
+    Crypto prices are fetched together in one exchange request; other assets
+    are fetched concurrently, so the total time is about that of the slowest
+    request rather than the sum of all of them. Duplicates are fetched once.
+    
+    Args:
+        assets: (symbol, asset_type) pairs
+        exchange (str): Exchange for crypto (default: 'binance')
+        max_workers (int): Maximum concurrent requests for non-crypto assets
+        
+    Returns:
+        tuple: (prices, errors) - price by (symbol, asset_type) for successful
+        fetches, and the error message by (symbol, asset_type) for failures
+    """
+    unique_assets = list(dict.fromkeys(assets))
+    prices: Dict[Tuple[str, str], float] = {}
+    errors: Dict[Tuple[str, str], str] = {}
+    
+    crypto = [asset for asset in unique_assets
+              if isinstance(asset[1], str) and asset[1].lower().strip() in ('crypto', 'cryptocurrency')]
+    crypto_set = set(crypto)
+    others = [asset for asset in unique_assets if asset not in crypto_set]
+    
+    # Crypto: one batch request, falling back to per-symbol fetches for misses
+    if crypto:
+        try:
+            crypto_prices = get_crypto_prices((symbol for symbol, _ in crypto), exchange)
+        except DataFetchError as e:
+            logger.warning(f"Batch crypto price fetch failed, fetching individually: {e}")
+            crypto_prices = {}
+        for asset in crypto:
+            if asset[0] in crypto_prices:
+                prices[asset] = crypto_prices[asset[0]]
+            else:
+                others.append(asset)
+    
+    # Everything else: concurrent single-symbol requests
+    if others:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(others))) as executor:
+            futures = {
+                executor.submit(get_market_price, symbol, asset_type, exchange): (symbol, asset_type)
+                for symbol, asset_type in others
+            }
+            for future in as_completed(futures):
+                asset = futures[future]
+                try:
+                    prices[asset] = future.result()
+                except Exception as e:
+                    errors[asset] = str(e)
+    
+    return prices, errors
+
+
 def test_api_connectivity() -> dict:
     """
     Test connectivity to various data APIs.
@@ -8,6 +8,7 @@ expenses, savings, trades, and positions.
 
 import sqlite3
 import logging
+import hashlib
 from pathlib import Path
 from typing import List, Dict, Optional, Any, Union
 from contextlib import contextmanager
@@ -37,6 +38,30 @@ class AlphaDatabase:
         self._create_tables()
         logger.info(f"Database initialized: {self.db_path}")
     
+    def _fetch_columns(self, query: str, params: tuple = ()) -> Dict[str, List[Any]]:
+        """
+        Run a query and return its result transposed into columns.
+        
+        Rows are fetched as plain tuples, so no per-row dictionary or
+        sqlite3.Row object is built.
+        
+        Args:
+            query (str): SQL query to execute
+            params (tuple): Query parameters
+            
+        Returns:
+            dict: Column names as keys, lists of column values as values
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(query, params)
+            names = [description[0] for description in cursor.description]
+            rows = cursor.fetchall()
+        
+        columns = zip(*rows) if rows else ([] for _ in names)
+        return {name: list(values) for name, values in zip(names, columns)}
+    
     @contextmanager
     def get_connection(self):
         """
@@ -245,6 +270,17 @@ class AlphaDatabase:
             cursor.execute(query)
             return [dict(row) for row in cursor.fetchall()]
     
+    def get_expense_columns(self) -> Dict[str, List[Any]]:
+        """
+        Get all expenses column-wise, in the same order as get_all_expenses.
+        
+        Returns:
+            dict: Column names as keys, lists of column values as values
+        """
+        return self._fetch_columns(
+            "SELECT id, date, category, amount, note FROM expenses ORDER BY date DESC"
+        )
+    
     def get_expenses_by_category(self, category: str) -> List[Dict[str, Any]]:
         """
         Get all expenses for a specific category.
@@ -410,6 +446,17 @@ class AlphaDatabase:
             cursor.execute(query)
             return [dict(row) for row in cursor.fetchall()]
     
+    def get_savings_columns(self) -> Dict[str, List[Any]]:
+        """
+        Get all savings column-wise, in the same order as get_all_savings.
+        
+        Returns:
+            dict: Column names as keys, lists of column values as values
+        """
+        return self._fetch_columns(
+            "SELECT id, date, source, amount, note FROM savings ORDER BY date DESC"
+        )
+    
     def get_savings_by_source(self, source: str) -> List[Dict[str, Any]]:
         """
         Get all savings for a specific source.
@@ -687,6 +734,33 @@ class AlphaDatabase:
                 logger.info(f"Deleted position ID {position_id}")
             return success
     
+    def delete_positions(self, position_ids: List[int]) -> int:
+        """
+        Delete several position records in one transaction.
+        
+        Args:
+            position_ids (list): IDs of the positions to delete
+            
+        Returns:
+            int: Number of positions deleted
+        """
+        if not position_ids:
+            return 0
+        
+        # Chunked to stay under SQLite's bound-parameter limit
+        chunk_size = 500
+        deleted = 0
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(position_ids), chunk_size):
+                chunk = list(position_ids[start:start + chunk_size])
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(f"DELETE FROM positions WHERE id IN ({placeholders})", chunk)
+                deleted += cursor.rowcount
+            conn.commit()
+            logger.info(f"Deleted {deleted} positions")
+            return deleted
+    
     def get_position(self, position_id: int) -> Optional[Dict[str, Any]]:
         """
         Get a specific position by ID.
@@ -715,6 +789,30 @@ class AlphaDatabase:
             cursor.execute("SELECT * FROM positions ORDER BY symbol")
             return [dict(row) for row in cursor.fetchall()]
     
+    def get_positions_version(self) -> tuple:
+        """
+        Get a fingerprint of the positions table.
+        
+        Every column of every row is folded into a digest inside SQLite, so
+        any added, deleted or edited position changes the fingerprint while
+        only a single short string is returned.
+        
+        Returns:
+            tuple: (row count, SHA-1 hex digest of all rows)
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT COUNT(*), group_concat(row_text, char(10)) FROM (
+                    SELECT id || ',' || quote(symbol) || ',' || quote(asset_type) || ','
+                           || quote(entry_date) || ',' || quote(entry_price) || ','
+                           || quote(quantity) AS row_text
+                    FROM positions ORDER BY id
+                )
+            """)
+            count, rows_text = cursor.fetchone()
+            return count, hashlib.sha1((rows_text or "").encode("utf-8")).hexdigest()
+    
     def get_position_by_symbol(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
         Get position for a specific symbol.
@@ -9,6 +9,7 @@ Provides a clean API layer over the database for financial operations.
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 import logging
+import numpy as np
 
 # Import the database layer
 from db import AlphaDatabase
@@ -22,6 +23,47 @@ class PersonalFinanceError(Exception):
     pass
 
 
+def _sum_amounts(records: List[Dict[str, Any]]) -> float:
+    """
+    Sum the 'amount' field of records as one NumPy reduction.
+    
+    Args:
+        records (list): Expense or savings dictionaries
+        
+    Returns:
+        float: Total amount
+    """
+    amounts = np.fromiter((record['amount'] for record in records),
+                          dtype=np.float64, count=len(records))
+    return float(amounts.sum())
+
+
+def _sum_by_key(keys: List[str], amounts: List[float]) -> Dict[str, float]:
+    """
+    Sum amounts per key with NumPy instead of a Python dict loop.
+    
+    Each key is mapped to an integer label by np.unique and the amounts are
+    added per label by np.bincount, so the per-record work runs in C.
+    
+    Args:
+        keys (list): Group key for each record
+        amounts (list): Amount for each record
+        
+    Returns:
+        dict: Keys in order of first appearance, summed amounts as values
+    """
+    if not keys:
+        return {}
+    
+    unique_keys, first_rows, labels = np.unique(
+        np.asarray(keys), return_index=True, return_inverse=True
+    )
+    totals = np.bincount(labels, weights=np.asarray(amounts, dtype=np.float64))
+    
+    # np.unique sorts the keys; restore first-appearance order
+    return {str(unique_keys[i]): float(totals[i]) for i in np.argsort(first_rows)}
+
+
 class PersonalFinance:
     """
     Personal Finance management class for the Alpha application.
@@ -39,6 +81,11 @@ class PersonalFinance:
             database (AlphaDatabase): Instance of the database manager
         """
         self.db = database
+        
+        # Unfiltered totals, computed on demand and dropped on any change
+        self._expense_total_cache: Optional[float] = None
+        self._savings_total_cache: Optional[float] = None
+        
         logger.info("PersonalFinance manager initialized")
     
     # ==================== EXPENSE MANAGEMENT ====================
@@ -66,6 +113,7 @@ class PersonalFinance:
         
         try:
             expense_id = self.db.add_expense(date, category, amount, note)
+            self._expense_total_cache = None
             logger.info(f"Added expense: {category} - ${amount}")
             return expense_id
         except Exception as e:
@@ -104,6 +152,7 @@ class PersonalFinance:
         try:
             success = self.db.update_expense(expense_id, date, category, amount, note)
             if success:
+                self._expense_total_cache = None
                 logger.info(f"Updated expense ID {expense_id}")
             return success
         except Exception as e:
@@ -129,6 +178,7 @@ class PersonalFinance:
         try:
             success = self.db.delete_expense(expense_id)
             if success:
+                self._expense_total_cache = None
                 logger.info(f"Deleted expense ID {expense_id}")
             return success
         except Exception as e:
@@ -165,6 +215,18 @@ class PersonalFinance:
         except Exception as e:
             raise PersonalFinanceError(f"Failed to retrieve expenses: {str(e)}")
     
+    def get_expense_columns(self) -> Dict[str, List[Any]]:
+        """
+        Get all expenses column-wise.
+        
+        Returns:
+            dict: Lists of 'id', 'date', 'category', 'amount' and 'note' values
+        """
+        try:
+            return self.db.get_expense_columns()
+        except Exception as e:
+            raise PersonalFinanceError(f"Failed to retrieve expenses: {str(e)}")
+    
     def get_expenses_by_category(self, category: str) -> List[Dict[str, Any]]:
         """
         Get all expenses for a specific category.
@@ -229,6 +291,7 @@ class PersonalFinance:
         
         try:
             savings_id = self.db.add_savings(date, source, amount, note)
+            self._savings_total_cache = None
             logger.info(f"Added savings: {source} - ${amount}")
             return savings_id
         except Exception as e:
@@ -267,6 +330,7 @@ class PersonalFinance:
         try:
             success = self.db.update_savings(savings_id, date, source, amount, note)
             if success:
+                self._savings_total_cache = None
                 logger.info(f"Updated savings ID {savings_id}")
             return success
         except Exception as e:
@@ -292,6 +356,7 @@ class PersonalFinance:
         try:
             success = self.db.delete_savings(savings_id)
             if success:
+                self._savings_total_cache = None
                 logger.info(f"Deleted savings ID {savings_id}")
             return success
         except Exception as e:
@@ -328,6 +393,18 @@ class PersonalFinance:
         except Exception as e:
             raise PersonalFinanceError(f"Failed to retrieve savings: {str(e)}")
     
+    def get_savings_columns(self) -> Dict[str, List[Any]]:
+        """
+        Get all savings column-wise.
+        
+        Returns:
+            dict: Lists of 'id', 'date', 'source', 'amount' and 'note' values
+        """
+        try:
+            return self.db.get_savings_columns()
+        except Exception as e:
+            raise PersonalFinanceError(f"Failed to retrieve savings: {str(e)}")
+    
     def get_savings_by_source(self, source: str) -> List[Dict[str, Any]]:
         """
         Get all savings for a specific source.
@@ -365,9 +442,11 @@ class PersonalFinance:
             elif category:
                 expenses = self.get_expenses_by_category(category)
             else:
-                expenses = self.get_all_expenses()
+                if self._expense_total_cache is None:
+                    self._expense_total_cache = _sum_amounts(self.get_all_expenses())
+                return self._expense_total_cache
             
-            return sum(expense['amount'] for expense in expenses)
+            return _sum_amounts(expenses)
         except Exception as e:
             raise PersonalFinanceError(f"Failed to calculate expense total: {str(e)}")
     
@@ -385,6 +464,11 @@ class PersonalFinance:
             float: Total savings amount
         """
         try:
+            if not (source or (start_date and end_date)):
+                if self._savings_total_cache is None:
+                    self._savings_total_cache = _sum_amounts(self.get_all_savings())
+                return self._savings_total_cache
+            
             if source:
                 savings = self.get_savings_by_source(source)
             else:
@@ -394,7 +478,7 @@ class PersonalFinance:
             if start_date and end_date:
                 savings = [s for s in savings if start_date <= s['date'] <= end_date]
             
-            return sum(saving['amount'] for saving in savings)
+            return _sum_amounts(savings)
         except Exception as e:
             raise PersonalFinanceError(f"Failed to calculate savings total: {str(e)}")
     
@@ -440,16 +524,37 @@ class PersonalFinance:
             else:
                 expenses = self.get_all_expenses()
             
-            breakdown = {}
-            for expense in expenses:
-                category = expense['category']
-                amount = expense['amount']
-                breakdown[category] = breakdown.get(category, 0) + amount
-            
-            return breakdown
+            return _sum_by_key([expense['category'] for expense in expenses],
+                               [expense['amount'] for expense in expenses])
         except Exception as e:
             raise PersonalFinanceError(f"Failed to generate expense breakdown: {str(e)}")
     
+    def get_savings_breakdown_by_source(self, start_date: str = None, end_date: str = None,
+                                        savings: List[Dict[str, Any]] = None) -> Dict[str, float]:
+        """
+        Get savings breakdown by source.
+        
+        Args:
+            start_date (str, optional): Start date filter
+            end_date (str, optional): End date filter
+            savings (list, optional): Savings records to aggregate; fetched if omitted
+            
+        Returns:
+            dict: Source names as keys, total amounts as values, in order of first appearance
+        """
+        try:
+            if savings is None:
+                savings = self.get_all_savings()
+            
+            # Apply date filtering if specified
+            if start_date and end_date:
+                savings = [s for s in savings if start_date <= s['date'] <= end_date]
+            
+            return _sum_by_key([saving['source'] for saving in savings],
+                               [saving['amount'] for saving in savings])
+        except Exception as e:
+            raise PersonalFinanceError(f"Failed to generate savings breakdown: {str(e)}")
+    
     # ==================== VALIDATION METHODS ====================
     
     def _validate_date(self, date: str) -> None:
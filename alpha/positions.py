@@ -6,23 +6,47 @@ Includes monitoring current positions, calculating P&L, and real-time value upda
 Provides a clean API layer over the database with live market data integration.
 """
 
-from typing import List, Dict, Optional, Any
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime
 import logging
+import threading
+import time
+import numpy as np
 
 # Import the database layer and data fetching functions
 from db import AlphaDatabase
-from datafetch import get_market_price, DataFetchError
+from datafetch import get_market_price, get_market_prices, DataFetchError
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Supported asset types, in the order offered to the user
+ASSET_TYPES = ("stock", "crypto", "etf", "forex", "commodity", "bond", "option", "future")
+
 
 class PositionsError(Exception):
     """Custom exception for position management operations."""
     pass
 
 
+@dataclass
+class PositionsSnapshot:
+    """
+    Positions and the analytics derived from them, from one live price fetch.
+    
+    Attributes:
+        positions: All positions enhanced with live prices and P&L
+        portfolio_pnl: Portfolio P&L summary (see calculate_portfolio_pnl)
+        positions_summary: Positions summary (see get_positions_summary)
+        top_performers: Top positions by P&L percentage
+    """
+    positions: List[Dict[str, Any]]
+    portfolio_pnl: Dict[str, Any]
+    positions_summary: Dict[str, Any]
+    top_performers: List[Dict[str, Any]]
+
+
 class OpenPositions:
     """
     Open Positions management class for the Alpha application.
@@ -40,7 +64,14 @@ class OpenPositions:
             database (AlphaDatabase): Instance of the database manager
         """
         self.db = database
-        self.valid_asset_types = {'stock', 'crypto', 'etf', 'forex', 'commodity', 'bond', 'option', 'future'}
+        self.valid_asset_types = set(ASSET_TYPES)
+        
+        # Recently fetched live prices:
+        # (symbol, asset_type) -> (price, fetched at, time.monotonic() stamp).
+        # Shared by the UI's background fetches, hence the lock.
+        self.quote_ttl_seconds = 10.0
+        self._quote_cache: Dict[Tuple[str, str], Tuple[float, datetime, float]] = {}
+        self._quote_cache_lock = threading.Lock()
         logger.info("OpenPositions manager initialized")
     
     # ==================== POSITION MANAGEMENT ====================
@@ -57,6 +88,20 @@ class OpenPositions:
         except Exception as e:
             raise PositionsError(f"Failed to retrieve positions: {str(e)}")
     
+    def positions_version(self) -> tuple:
+        """
+        Get a fingerprint of the stored positions.
+        
+        Equal fingerprints mean a reload would return the same positions.
+        
+        Returns:
+            tuple: Opaque fingerprint to compare with an earlier one
+        """
+        try:
+            return self.db.get_positions_version()
+        except Exception as e:
+            raise PositionsError(f"Failed to check positions version: {str(e)}")
+    
     def get_position(self, position_id: int) -> Optional[Dict[str, Any]]:
         """
         Get a specific position by ID.
@@ -123,9 +168,6 @@ class OpenPositions:
         if not position:
             raise PositionsError("Position data is required")
         
-        # Create a copy to avoid modifying original
-        enhanced_position = position.copy()
-        
         try:
             # Fetch live price
             live_price = get_market_price(
@@ -133,49 +175,10 @@ class OpenPositions:
                 asset_type=position['asset_type'],
                 exchange=exchange
             )
-            
-            # Calculate P&L metrics
-            entry_price = float(position['entry_price'])
-            quantity = float(position['quantity'])
-            
-            # Market value calculations
-            entry_value = entry_price * quantity
-            current_value = live_price * quantity
-            
-            # P&L calculations
-            unrealized_pnl = current_value - entry_value
-            unrealized_pnl_percent = (unrealized_pnl / entry_value) * 100 if entry_value > 0 else 0
-            
-            # Add calculated fields
-            enhanced_position.update({
-                'live_price': live_price,
-                'entry_value': entry_value,
-                'current_value': current_value,
-                'unrealized_pnl': unrealized_pnl,
-                'unrealized_pnl_percent': unrealized_pnl_percent,
-                'price_change': live_price - entry_price,
-                'price_change_percent': ((live_price - entry_price) / entry_price) * 100 if entry_price > 0 else 0,
-                'last_updated': datetime.now().isoformat()
-            })
-            
-            logger.info(f"Enhanced {position['symbol']} with live price ${live_price:.2f}, P&L: ${unrealized_pnl:.2f}")
-            return enhanced_position
+            return self._with_live_price(position, live_price)
             
         except DataFetchError as e:
-            logger.warning(f"Failed to fetch live price for {position['symbol']}: {e}")
-            # Return position with error information
-            enhanced_position.update({
-                'live_price': None,
-                'entry_value': float(position['entry_price']) * float(position['quantity']),
-                'current_value': None,
-                'unrealized_pnl': None,
-                'unrealized_pnl_percent': None,
-                'price_change': None,
-                'price_change_percent': None,
-                'price_error': str(e),
-                'last_updated': datetime.now().isoformat()
-            })
-            return enhanced_position
+            return self._with_price_error(position, str(e))
         
         except Exception as e:
             raise PositionsError(f"Failed to enhance position with live data: {str(e)}")
@@ -184,6 +187,12 @@ class OpenPositions:
         """
         Get all positions enhanced with live prices and P&L calculations.
         
+        Prices for all positions are fetched in one batch (see
+        datafetch.get_market_prices) rather than one request after another.
+        Prices fetched less than quote_ttl_seconds ago are reused; only
+        the stale ones are requested. P&L figures for all priced positions
+        are derived together with array arithmetic.
+        
         Args:
             exchange (str): Exchange for crypto prices (default: 'binance')
             
@@ -192,11 +201,31 @@ class OpenPositions:
         """
         try:
             positions = self.get_all_positions()
-            enhanced_positions = []
+            assets = {(position['symbol'], position['asset_type']) for position in positions}
+            
+            quotes = self._cached_quotes(assets)
+            stale_assets = assets - quotes.keys()
+            errors = {}
+            if stale_assets:
+                prices, errors = get_market_prices(stale_assets, exchange=exchange)
+                quotes.update(self._cache_quotes(prices))
             
+            # Priced rows are filled in below, all at once
+            enhanced_positions = []
+            priced_rows, priced_quotes = [], []
             for position in positions:
-                enhanced_position = self.get_position_with_live_price(position, exchange)
-                enhanced_positions.append(enhanced_position)
+                asset = (position['symbol'], position['asset_type'])
+                if asset in quotes:
+                    priced_rows.append(len(enhanced_positions))
+                    priced_quotes.append(quotes[asset])
+                    enhanced_positions.append(position)
+                else:
+                    error = errors.get(asset, f"No price returned for {position['symbol']}")
+                    enhanced_positions.append(self._with_price_error(position, error))
+            
+            priced = self._with_live_prices([enhanced_positions[row] for row in priced_rows], priced_quotes)
+            for row, position in zip(priced_rows, priced):
+                enhanced_positions[row] = position
             
             logger.info(f"Enhanced {len(enhanced_positions)} positions with live data")
             return enhanced_positions
@@ -204,20 +233,176 @@ class OpenPositions:
         except Exception as e:
             raise PositionsError(f"Failed to get positions with live prices: {str(e)}")
     
+    def _cached_quotes(self, assets) -> Dict[Tuple[str, str], Tuple[float, datetime]]:
+        """Return the cached (price, fetched at) of the given assets that are still fresh."""
+        cutoff = time.monotonic() - self.quote_ttl_seconds
+        fresh = {}
+        with self._quote_cache_lock:
+            for asset in assets:
+                cached = self._quote_cache.get(asset)
+                if cached and cached[2] >= cutoff:
+                    fresh[asset] = cached[:2]
+        return fresh
+    
+    def _cache_quotes(self, prices: Dict[Tuple[str, str], float]) -> Dict[Tuple[str, str], Tuple[float, datetime]]:
+        """Store freshly fetched prices and return them as (price, fetched at)."""
+        fetched_at = datetime.now()
+        stamp = time.monotonic()
+        with self._quote_cache_lock:
+            for asset, price in prices.items():
+                self._quote_cache[asset] = (price, fetched_at, stamp)
+        return {asset: (price, fetched_at) for asset, price in prices.items()}
+    
+    def invalidate_quote_cache(self):
+        """Forget cached live prices so the next fetch requests all of them."""
+        with self._quote_cache_lock:
+            self._quote_cache.clear()
+    
+    # Fields added by _with_live_prices, in the order they are computed
+    _LIVE_PRICE_FIELDS = (
+        'live_price', 'entry_value', 'current_value', 'unrealized_pnl',
+        'unrealized_pnl_percent', 'price_change', 'price_change_percent', 'last_updated'
+    )
+    
+    def _with_live_prices(self, positions: List[Dict[str, Any]],
+                          quotes: List[Tuple[float, datetime]]) -> List[Dict[str, Any]]:
+        """
+        Return copies of positions with live price and P&L fields added.
+        
+        Same fields as _with_live_price, but each derived figure is computed
+        for all positions at once over NumPy arrays.
+        
+        Args:
+            positions (list): Position data from database
+            quotes (list): (live price, fetched at) for each position
+            
+        Returns:
+            list: Enhanced position data, in the same order
+        """
+        if not positions:
+            return []
+        
+        entry_price = np.array([float(position['entry_price']) for position in positions])
+        quantity = np.array([float(position['quantity']) for position in positions])
+        live_price = np.array([price for price, _ in quotes], dtype=float)
+        
+        entry_value = entry_price * quantity
+        current_value = live_price * quantity
+        unrealized_pnl = current_value - entry_value
+        price_change = live_price - entry_price
+        
+        # Percentages are 0 where the base is not positive
+        with np.errstate(divide='ignore', invalid='ignore'):
+            unrealized_pnl_percent = np.where(entry_value > 0, unrealized_pnl / entry_value * 100, 0.0)
+            price_change_percent = np.where(entry_price > 0, price_change / entry_price * 100, 0.0)
+        
+        columns = zip(
+            live_price.tolist(), entry_value.tolist(), current_value.tolist(),
+            unrealized_pnl.tolist(), unrealized_pnl_percent.tolist(),
+            price_change.tolist(), price_change_percent.tolist(),
+            (fetched_at.isoformat() for _, fetched_at in quotes)
+        )
+        
+        enhanced_positions = []
+        for position, values in zip(positions, columns):
+            enhanced_position = position.copy()
+            enhanced_position.update(zip(self._LIVE_PRICE_FIELDS, values))
+            enhanced_positions.append(enhanced_position)
+        return enhanced_positions
+    
+    def _with_live_price(self, position: Dict[str, Any], live_price: float,
+                         fetched_at: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Return a copy of a position with live price and P&L fields added.
+        
+        Args:
+            position (dict): Position data from database
+            live_price (float): Current market price
+            fetched_at (datetime, optional): When the price was fetched
+                (default: now)
+            
+        Returns:
+            dict: Enhanced position data
+        """
+        # Create a copy to avoid modifying original
+        enhanced_position = position.copy()
+        
+        # Calculate P&L metrics
+        entry_price = float(position['entry_price'])
+        quantity = float(position['quantity'])
+        
+        # Market value calculations
+        entry_value = entry_price * quantity
+        current_value = live_price * quantity
+        
+        # P&L calculations
+        unrealized_pnl = current_value - entry_value
+        unrealized_pnl_percent = (unrealized_pnl / entry_value) * 100 if entry_value > 0 else 0
+        
+        # Add calculated fields
+        enhanced_position.update({
+            'live_price': live_price,
+            'entry_value': entry_value,
+            'current_value': current_value,
+            'unrealized_pnl': unrealized_pnl,
+            'unrealized_pnl_percent': unrealized_pnl_percent,
+            'price_change': live_price - entry_price,
+            'price_change_percent': ((live_price - entry_price) / entry_price) * 100 if entry_price > 0 else 0,
+            'last_updated': (fetched_at or datetime.now()).isoformat()
+        })
+        
+        logger.info(f"Enhanced {position['symbol']} with live price ${live_price:.2f}, P&L: ${unrealized_pnl:.2f}")
+        return enhanced_position
+    
+    def _with_price_error(self, position: Dict[str, Any], error: str) -> Dict[str, Any]:
+        """
+        Return a copy of a position marked as missing its live price.
+        
+        Args:
+            position (dict): Position data from database
+            error (str): Why the price could not be fetched
+            
+        Returns:
+            dict: Position data with empty live fields and the error
+        """
+        logger.warning(f"Failed to fetch live price for {position['symbol']}: {error}")
+        
+        # Create a copy to avoid modifying original
+        enhanced_position = position.copy()
+        
+        # Return position with error information
+        enhanced_position.update({
+            'live_price': None,
+            'entry_value': float(position['entry_price']) * float(position['quantity']),
+            'current_value': None,
+            'unrealized_pnl': None,
+            'unrealized_pnl_percent': None,
+            'price_change': None,
+            'price_change_percent': None,
+            'price_error': error,
+            'last_updated': datetime.now().isoformat()
+        })
+        return enhanced_position
+    
     # ==================== P&L ANALYTICS ====================
     
-    def calculate_portfolio_pnl(self, exchange: str = "binance") -> Dict[str, Any]:
+    def calculate_portfolio_pnl(self, exchange: str = "binance",
+                                positions: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
         """
         Calculate overall portfolio P&L metrics.
         
         Args:
             exchange (str): Exchange for crypto prices (default: 'binance')
+            positions (list, optional): Positions already enhanced with live
+                prices; fetched when not given
             
         Returns:
             dict: Portfolio P&L summary
         """
         try:
-            enhanced_positions = self.get_all_positions_with_live_prices(exchange)
+            if positions is None:
+                positions = self.get_all_positions_with_live_prices(exchange)
+            enhanced_positions = positions
             
             portfolio_summary = {
                 'total_positions': len(enhanced_positions),
@@ -294,19 +479,24 @@ class OpenPositions:
         except Exception as e:
             raise PositionsError(f"Failed to calculate portfolio P&L: {str(e)}")
     
-    def get_top_performers(self, limit: int = 5, exchange: str = "binance") -> List[Dict[str, Any]]:
+    def get_top_performers(self, limit: int = 5, exchange: str = "binance",
+                           positions: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
         """
         Get top performing positions by P&L percentage.
         
         Args:
             limit (int): Number of top performers to return
             exchange (str): Exchange for crypto prices (default: 'binance')
+            positions (list, optional): Positions already enhanced with live
+                prices; fetched when not given
             
         Returns:
             list: Top performing positions sorted by P&L percentage
         """
         try:
-            enhanced_positions = self.get_all_positions_with_live_prices(exchange)
+            if positions is None:
+                positions = self.get_all_positions_with_live_prices(exchange)
+            enhanced_positions = positions
             
             # Filter out positions without valid P&L data
             valid_positions = [
@@ -326,19 +516,28 @@ class OpenPositions:
         except Exception as e:
             raise PositionsError(f"Failed to get top performers: {str(e)}")
     
-    def get_positions_summary(self, exchange: str = "binance") -> Dict[str, Any]:
+    def get_positions_summary(self, exchange: str = "binance",
+                              positions: Optional[List[Dict[str, Any]]] = None,
+                              portfolio_pnl: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Get a comprehensive summary of all positions.
         
         Args:
             exchange (str): Exchange for crypto prices (default: 'binance')
+            positions (list, optional): Positions already enhanced with live
+                prices; fetched when not given
+            portfolio_pnl (dict, optional): Portfolio P&L already calculated
+                from the same positions
             
         Returns:
             dict: Comprehensive positions summary
         """
         try:
-            portfolio_pnl = self.calculate_portfolio_pnl(exchange)
-            top_performers = self.get_top_performers(3, exchange)
+            if positions is None:
+                positions = self.get_all_positions_with_live_prices(exchange)
+            if portfolio_pnl is None:
+                portfolio_pnl = self.calculate_portfolio_pnl(exchange, positions)
+            top_performers = self.get_top_performers(3, exchange, positions)
             
             summary = {
                 'portfolio': portfolio_pnl,
@@ -351,6 +550,29 @@ class OpenPositions:
         except Exception as e:
             raise PositionsError(f"Failed to generate positions summary: {str(e)}")
     
+    def snapshot(self, top_limit: int = 10, exchange: str = "binance") -> PositionsSnapshot:
+        """
+        Get positions, portfolio P&L, summary and top performers together.
+        
+        Live prices are fetched once and every figure is derived from that
+        single set, instead of each analytics call fetching its own.
+        
+        Args:
+            top_limit (int): Number of top performers to include
+            exchange (str): Exchange for crypto prices (default: 'binance')
+            
+        Returns:
+            PositionsSnapshot: Positions and derived analytics
+        """
+        positions = self.get_all_positions_with_live_prices(exchange)
+        portfolio_pnl = self.calculate_portfolio_pnl(exchange, positions)
+        return PositionsSnapshot(
+            positions=positions,
+            portfolio_pnl=portfolio_pnl,
+            positions_summary=self.get_positions_summary(exchange, positions, portfolio_pnl),
+            top_performers=self.get_top_performers(top_limit, exchange, positions)
+        )
+    
     # ==================== POSITION CRUD OPERATIONS ====================
     
     def add_position(self, symbol: str, asset_type: str, entry_date: str, 
@@ -513,6 +735,34 @@ class OpenPositions:
             
         except Exception as e:
             raise PositionsError(f"Failed to delete position: {str(e)}")
+    
+    def delete_positions(self, position_ids: List[int]) -> int:
+        """
+        Delete several positions from the portfolio at once.
+        
+        All positions are removed in a single database transaction.
+        
+        Args:
+            position_ids (list): IDs of the positions to delete
+            
+        Returns:
+            int: Number of positions deleted
+            
+        Raises:
+            PositionsError: If database operation fails
+        """
+        try:
+            deleted = self.db.delete_positions(position_ids)
+            
+            if deleted < len(position_ids):
+                logger.warning(f"Deleted {deleted} of {len(position_ids)} positions; the rest were not found")
+            else:
+                logger.info(f"Deleted {deleted} positions")
+            
+            return deleted
+            
+        except Exception as e:
+            raise PositionsError(f"Failed to delete positions: {str(e)}")
 
 
 if __name__ == "__main__":
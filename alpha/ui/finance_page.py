@@ -8,28 +8,396 @@ Integrates with PersonalFinance business logic while maintaining separation of c
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTableWidget, QTableWidgetItem, QTabWidget, QGroupBox, 
+    QTableView, QTabWidget, QGroupBox, 
     QFormLayout, QLineEdit, QComboBox, QDateEdit, QDoubleSpinBox, 
     QTextEdit, QSplitter, QMessageBox, QDialog, QDialogButtonBox,
     QHeaderView, QAbstractItemView, QFrame
 )
-from PySide6.QtCore import Qt, QDate, Signal
+from PySide6.QtCore import (
+    Qt, QDate, QTimer, Signal, QSignalBlocker, QAbstractTableModel, QModelIndex
+)
 from PySide6.QtGui import QFont, QColor
 import logging
+import math
+from array import array
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
+import numpy as np
 
 # Import business logic
 from finance import PersonalFinance, PersonalFinanceError
 from db import AlphaDatabase
 
+from .views import ReportView, frozen
+from .workers import TaskThread
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Alignment for the amount column, combined once rather than per cell
+_RIGHT_VCENTER = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+# Tab titles, shared by the placeholder and the built tab
+_TAB_EXPENSES = "💸 Expenses"
+_TAB_SAVINGS = "💰 Savings"
+_TAB_SUMMARY = "📊 Summary"
+
+# Shared fonts, created on first use (a QApplication must exist by then)
+_TITLE_FONT: Optional[QFont] = None
+_HEADER_FONT: Optional[QFont] = None
+
+
+def _make_font(point_size: int, bold: bool) -> QFont:
+    """Create a font with the given point size and weight."""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
+
+
+def _title_font() -> QFont:
+    """Return the shared page title font."""
+    global _TITLE_FONT
+    if _TITLE_FONT is None:
+        _TITLE_FONT = _make_font(18, True)
+    return _TITLE_FONT
+
+
+def _header_font() -> QFont:
+    """Return the shared section header font."""
+    global _HEADER_FONT
+    if _HEADER_FONT is None:
+        _HEADER_FONT = _make_font(14, True)
+    return _HEADER_FONT
+
+
+@lru_cache(maxsize=256)
+def _qdate_to_iso(julian_day: int) -> str:
+    """Return the ISO 8601 (YYYY-MM-DD) string for a Julian day number."""
+    return QDate.fromJulianDay(julian_day).toString(Qt.DateFormat.ISODate)
+
+
+# One summary breakdown line: name, amount and share of the total
+_BREAKDOWN_LINE = "• {0:<15}: ${1:>8,.2f} ({2:>5.1f}%)".format
+
+
+def _breakdown_lines(breakdown: Dict[str, float], total: float) -> List[str]:
+    """Format a name -> amount breakdown as summary lines with percentages."""
+    # One division per breakdown; each row is then a single multiply
+    percent_per_unit = 100.0 / total if total > 0 else 0.0
+    return [_BREAKDOWN_LINE(name, amount, amount * percent_per_unit)
+            for name, amount in breakdown.items()]
+
+
+class FinanceRecords:
+    """
+    Column-oriented store for expense or savings records.
+    
+    Each field is kept in its own column instead of one dict per record:
+    IDs and amounts live in typed arrays, so totals and sorts scan one
+    contiguous column rather than hashing into a dict per row. Display
+    text for amounts is formatted once on ingest rather than on every paint.
+    
+    Categories/sources are dictionary-encoded: each row stores a small
+    integer code into label_names, so a label repeated across thousands
+    of rows is held once and compared as an integer.
+    """
+    
+    def __init__(self, label_key: str):
+        """
+        Initialize an empty store.
+        
+        Args:
+            label_key: Record field stored in the label column ('category' or 'source')
+        """
+        self.label_key = label_key
+        self.ids = array('q')
+        self.dates: List[str] = []
+        self.amounts = array('d')
+        self.amount_texts: List[str] = []
+        self.label_codes = array('l')
+        self.notes: List[str] = []
+        self._row_by_id: Dict[int, int] = {}
+        
+        # Label dictionary: code -> category/source name, and its inverse
+        self.label_names: List[str] = []
+        self._label_code_by_name: Dict[str, int] = {}
+    
+    @classmethod
+    def from_columns(cls, columns: Dict[str, List[Any]], label_key: str) -> 'FinanceRecords':
+        """Build the store from column lists as returned by the database layer."""
+        store = cls(label_key)
+        store.ids = array('q', columns['id'])
+        store.dates = columns['date']
+        store.amounts = array('d', columns['amount'])
+        store.amount_texts = [f"${amount:.2f}" for amount in store.amounts]
+        
+        encode = store._encode_label
+        store.label_codes = array('l', [encode(label) for label in columns[label_key]])
+        
+        # Description is stored as 'note' in the database
+        store.notes = [note or '' for note in columns['note']]
+        store._row_by_id = {record_id: row for row, record_id in enumerate(store.ids)}
+        return store
+    
+    def _encode_label(self, label: str) -> int:
+        """Return the dictionary code for a label, adding it if new."""
+        code = self._label_code_by_name.get(label)
+        if code is None:
+            code = len(self.label_names)
+            self.label_names.append(label)
+            self._label_code_by_name[label] = code
+        return code
+    
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return len(self.ids)
+    
+    def label(self, row: int) -> str:
+        """Return the category/source name at a row."""
+        return self.label_names[self.label_codes[row]]
+    
+    def row_of(self, record_id: int) -> Optional[int]:
+        """Return the row holding the given record ID, or None if absent."""
+        return self._row_by_id.get(record_id)
+    
+    def record(self, row: int) -> Dict[str, Any]:
+        """Return the record at a row as a database-shaped dictionary."""
+        return {
+            'id': self.ids[row],
+            'date': self.dates[row],
+            'amount': self.amounts[row],
+            self.label_key: self.label(row),
+            'note': self.notes[row],
+        }
+    
+    def append(self, record: Dict[str, Any]) -> int:
+        """Append a record and return its row."""
+        row = len(self.ids)
+        self.ids.append(record['id'])
+        self.dates.append(record['date'])
+        self.amounts.append(record['amount'])
+        self.amount_texts.append(f"${record['amount']:.2f}")
+        self.label_codes.append(self._encode_label(record[self.label_key]))
+        self.notes.append(record.get('note') or '')
+        self._row_by_id[record['id']] = row
+        return row
+    
+    def replace(self, row: int, record: Dict[str, Any]):
+        """Overwrite the fields of the record at a row (the ID is kept)."""
+        self.dates[row] = record['date']
+        self.amounts[row] = record['amount']
+        self.amount_texts[row] = f"${record['amount']:.2f}"
+        self.label_codes[row] = self._encode_label(record[self.label_key])
+        self.notes[row] = record.get('note') or ''
+    
+    def remove(self, row: int):
+        """Remove the record at a row."""
+        del self._row_by_id[self.ids[row]]
+        del self.ids[row]
+        del self.dates[row]
+        del self.amounts[row]
+        del self.amount_texts[row]
+        del self.label_codes[row]
+        del self.notes[row]
+        
+        # Records after the removed one move up a row
+        for moved_row in range(row, len(self.ids)):
+            self._row_by_id[self.ids[moved_row]] = moved_row
+    
+    def total(self) -> float:
+        """Return the sum of the amount column."""
+        return math.fsum(self.amounts)
+    
+    def reorder(self, order: List[int]):
+        """Permute every column so that new row i holds old row order[i]."""
+        self.ids = array('q', [self.ids[i] for i in order])
+        self.dates = [self.dates[i] for i in order]
+        self.amounts = array('d', [self.amounts[i] for i in order])
+        self.amount_texts = [self.amount_texts[i] for i in order]
+        self.label_codes = array('l', [self.label_codes[i] for i in order])
+        self.notes = [self.notes[i] for i in order]
+        self._row_by_id = {record_id: row for row, record_id in enumerate(self.ids)}
+
+
+class FinanceTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a FinanceRecords store.
+    
+    Cells are read straight from the store's columns by row index, so the
+    view only asks for the rows it actually paints and no per-cell items
+    are built.
+    """
+    
+    ID_COLUMN = 0
+    DATE_COLUMN = 1
+    AMOUNT_COLUMN = 2
+    LABEL_COLUMN = 3
+    DESCRIPTION_COLUMN = 4
+    TAGS_COLUMN = 5
+    
+    def __init__(self, records: FinanceRecords, label_header: str, parent=None):
+        """
+        Initialize the model.
+        
+        Args:
+            records: Initial record store
+            label_header: Header text for the label column
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._headers = ["ID", "Date", "Amount", label_header, "Description", "Tags"]
+        self._records = records
+        
+        # Last requested sort, re-applied when the records are replaced
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+    
+    def set_records(self, records: FinanceRecords):
+        """Replace the record store in a single model reset."""
+        self.beginResetModel()
+        self._records = records
+        if self._sort_column >= 0:
+            records.reorder(self._sorted_rows(self._sort_column, self._sort_order))
+        self.endResetModel()
+    
+    def record(self, row: int) -> Dict[str, Any]:
+        """Return the record shown at the given row."""
+        return self._records.record(row)
+    
+    def insert_record(self, record: Dict[str, Any]):
+        """Add one record without resetting the model."""
+        row = len(self._records)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._records.append(record)
+        self.endInsertRows()
+        self._reapply_sort()
+    
+    def update_record(self, row: int, record: Dict[str, Any]):
+        """Update one record in place and repaint only its row."""
+        self._records.replace(row, record)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self._headers) - 1))
+        self._reapply_sort()
+    
+    def remove_record(self, row: int):
+        """Remove one record without resetting the model."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._records.remove(row)
+        self.endRemoveRows()
+    
+    def _reapply_sort(self):
+        """Keep the last requested sort after a record was added or changed."""
+        if self._sort_column >= 0:
+            self.sort(self._sort_column, self._sort_order)
+    
+    def _sort_column_values(self, column: int):
+        """Return the raw values a column sorts by, or None if it is not sortable."""
+        records = self._records
+        if column == self.ID_COLUMN:
+            return records.ids
+        if column == self.DATE_COLUMN:
+            return records.dates
+        if column == self.AMOUNT_COLUMN:
+            return records.amounts
+        if column == self.LABEL_COLUMN:
+            # Rank the label dictionary once, then sort rows by integer rank
+            names = np.asarray(records.label_names, dtype=str)
+            rank_of_code = np.empty(len(names), dtype=np.intp)
+            rank_of_code[np.argsort(names, kind='stable')] = np.arange(len(names))
+            return rank_of_code[np.asarray(records.label_codes, dtype=np.intp)]
+        if column == self.DESCRIPTION_COLUMN:
+            return records.notes
+        return None
+    
+    def _sorted_rows(self, column: int, order: Qt.SortOrder) -> List[int]:
+        """Return the row permutation that sorts the store by a column."""
+        values = self._sort_column_values(column)
+        if values is None:
+            return list(range(len(self._records)))
+        
+        # Typed arrays are viewed without copying; text columns become
+        # fixed-width string arrays so the comparison runs in C
+        values = np.asarray(values)
+        if order == Qt.SortOrder.DescendingOrder:
+            # Sort the reversed column and map back so equal values keep
+            # their current relative order, as Qt's own sort does
+            reversed_order = np.argsort(values[::-1], kind='stable')
+            permutation = (len(values) - 1 - reversed_order)[::-1]
+        else:
+            permutation = np.argsort(values, kind='stable')
+        return permutation.tolist()
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of records."""
+        return 0 if parent.isValid() else len(self._records)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Return the number of columns."""
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Return the horizontal header labels."""
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return the display text and alignment for a cell."""
+        if not index.isValid():
+            return None
+        
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            row = index.row()
+            records = self._records
+            if column == self.ID_COLUMN:
+                return str(records.ids[row])
+            if column == self.DATE_COLUMN:
+                return records.dates[row]
+            if column == self.AMOUNT_COLUMN:
+                return records.amount_texts[row]
+            if column == self.LABEL_COLUMN:
+                return records.label(row)
+            if column == self.DESCRIPTION_COLUMN:
+                return records.notes[row]
+            # Tags are not stored in the database
+            return ''
+        
+        if role == Qt.ItemDataRole.TextAlignmentRole and column == self.AMOUNT_COLUMN:
+            return _RIGHT_VCENTER
+        
+        return None
+    
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Sort records by the raw value of a column, keeping the selection."""
+        if column < 0:
+            return
+        
+        self._sort_column = column
+        self._sort_order = order
+        
+        self.layoutAboutToBeChanged.emit()
+        new_order = self._sorted_rows(column, order)
+        self._records.reorder(new_order)
+        
+        # Move persistent indexes (selection, current index) with their rows
+        new_position = {old_row: new_row for new_row, old_row in enumerate(new_order)}
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.index(new_position[i.row()], i.column()) for i in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
 
 class AddExpenseDialog(QDialog):
     """Dialog for adding new expenses."""
     
+    _CATEGORIES = (
+        "Food & Dining", "Transportation", "Shopping", "Bills", 
+        "Entertainment", "Healthcare", "Travel", "Education", "Other"
+    )
+    _CATEGORY_INDEX = {category: i for i, category in enumerate(_CATEGORIES)}
+    
     def __init__(self, parent=None):
         """Initialize the add expense dialog."""
         super().__init__(parent)
@@ -56,11 +424,7 @@ class AddExpenseDialog(QDialog):
         # Category
         self.category_input = QComboBox()
         self.category_input.setEditable(True)
-        categories = [
-            "Food & Dining", "Transportation", "Shopping", "Bills", 
-            "Entertainment", "Healthcare", "Travel", "Education", "Other"
-        ]
-        self.category_input.addItems(categories)
+        self.category_input.addItems(self._CATEGORIES)
         form_layout.addRow("Category:", self.category_input)
         
         # Date
@@ -94,7 +458,7 @@ class AddExpenseDialog(QDialog):
         return {
             'amount': self.amount_input.value(),
             'category': self.category_input.currentText(),
-            'date': self.date_input.date().toString('yyyy-MM-dd'),
+            'date': _qdate_to_iso(self.date_input.date().toJulianDay()),
             'description': self.description_input.text(),
             'tags': self.tags_input.text()
         }
@@ -103,6 +467,12 @@ class AddExpenseDialog(QDialog):
 class AddSavingsDialog(QDialog):
     """Dialog for adding new savings records."""
     
+    _SOURCES = (
+        "Salary", "Freelance", "Investment", "Bonus", 
+        "Gift", "Refund", "Side Hustle", "Other"
+    )
+    _SOURCE_INDEX = {source: i for i, source in enumerate(_SOURCES)}
+    
     def __init__(self, parent=None):
         """Initialize the add savings dialog."""
         super().__init__(parent)
@@ -129,11 +499,7 @@ class AddSavingsDialog(QDialog):
         # Source
         self.source_input = QComboBox()
         self.source_input.setEditable(True)
-        sources = [
-            "Salary", "Freelance", "Investment", "Bonus", 
-            "Gift", "Refund", "Side Hustle", "Other"
-        ]
-        self.source_input.addItems(sources)
+        self.source_input.addItems(self._SOURCES)
         form_layout.addRow("Source:", self.source_input)
         
         # Date
@@ -167,7 +533,7 @@ class AddSavingsDialog(QDialog):
         return {
             'amount': self.amount_input.value(),
             'source': self.source_input.currentText(),
-            'date': self.date_input.date().toString('yyyy-MM-dd'),
+            'date': _qdate_to_iso(self.date_input.date().toJulianDay()),
             'description': self.description_input.text(),
             'tags': self.tags_input.text()
         }
@@ -184,22 +550,26 @@ class EditExpenseDialog(AddExpenseDialog):
     
     def _populate_form(self, data: Dict[str, Any]):
         """Populate the form with existing expense data."""
-        self.amount_input.setValue(float(data.get('amount', 0)))
-        
-        category = data.get('category', '')
-        index = self.category_input.findText(category)
-        if index >= 0:
-            self.category_input.setCurrentIndex(index)
-        else:
-            self.category_input.setCurrentText(category)
-        
-        date_str = data.get('date', '')
-        if date_str:
-            date = QDate.fromString(date_str, 'yyyy-MM-dd')
-            self.date_input.setDate(date)
-        
-        self.description_input.setText(data.get('description', ''))
-        self.tags_input.setText(data.get('tags', ''))
+        # Suppress change signals while filling the inputs
+        with QSignalBlocker(self.amount_input), QSignalBlocker(self.category_input), \
+                QSignalBlocker(self.date_input), QSignalBlocker(self.description_input), \
+                QSignalBlocker(self.tags_input):
+            self.amount_input.setValue(float(data.get('amount', 0)))
+            
+            category = data.get('category', '')
+            index = self._CATEGORY_INDEX.get(category, -1)
+            if index >= 0:
+                self.category_input.setCurrentIndex(index)
+            else:
+                self.category_input.setCurrentText(category)
+            
+            date_str = data.get('date', '')
+            if date_str:
+                date = QDate.fromString(date_str, 'yyyy-MM-dd')
+                self.date_input.setDate(date)
+            
+            self.description_input.setText(data.get('description', ''))
+            self.tags_input.setText(data.get('tags', ''))
 
 
 class EditSavingsDialog(AddSavingsDialog):
@@ -213,22 +583,26 @@ class EditSavingsDialog(AddSavingsDialog):
     
     def _populate_form(self, data: Dict[str, Any]):
         """Populate the form with existing savings data."""
-        self.amount_input.setValue(float(data.get('amount', 0)))
-        
-        source = data.get('source', '')
-        index = self.source_input.findText(source)
-        if index >= 0:
-            self.source_input.setCurrentIndex(index)
-        else:
-            self.source_input.setCurrentText(source)
-        
-        date_str = data.get('date', '')
-        if date_str:
-            date = QDate.fromString(date_str, 'yyyy-MM-dd')
-            self.date_input.setDate(date)
-        
-        self.description_input.setText(data.get('description', ''))
-        self.tags_input.setText(data.get('tags', ''))
+        # Suppress change signals while filling the inputs
+        with QSignalBlocker(self.amount_input), QSignalBlocker(self.source_input), \
+                QSignalBlocker(self.date_input), QSignalBlocker(self.description_input), \
+                QSignalBlocker(self.tags_input):
+            self.amount_input.setValue(float(data.get('amount', 0)))
+            
+            source = data.get('source', '')
+            index = self._SOURCE_INDEX.get(source, -1)
+            if index >= 0:
+                self.source_input.setCurrentIndex(index)
+            else:
+                self.source_input.setCurrentText(source)
+            
+            date_str = data.get('date', '')
+            if date_str:
+                date = QDate.fromString(date_str, 'yyyy-MM-dd')
+                self.date_input.setDate(date)
+            
+            self.description_input.setText(data.get('description', ''))
+            self.tags_input.setText(data.get('tags', ''))
 
 
 class FinancePage(QWidget):
@@ -248,6 +622,17 @@ class FinancePage(QWidget):
     # Signals for data updates
     data_updated = Signal()
     
+    # Tab indices
+    EXPENSES_TAB = 0
+    SAVINGS_TAB = 1
+    SUMMARY_TAB = 2
+    
+    # Columns sized to their contents after each refresh
+    _CONTENT_COLUMNS = (
+        FinanceTableModel.DATE_COLUMN, FinanceTableModel.AMOUNT_COLUMN,
+        FinanceTableModel.LABEL_COLUMN, FinanceTableModel.TAGS_COLUMN
+    )
+    
     def __init__(self, personal_finance: Optional[PersonalFinance] = None):
         """
         Initialize the Personal Finance page.
@@ -260,15 +645,38 @@ class FinancePage(QWidget):
         # Store business logic reference
         self.personal_finance = personal_finance
         
-        # Data storage for tables
-        self.expenses_data = []
-        self.savings_data = []
+        # Column-oriented record stores, shared with the table models
+        self.expenses_data = FinanceRecords('category')
+        self.savings_data = FinanceRecords('source')
         
-        self._setup_ui()
+        # Coalesces refresh requests into a single pass on the next event loop turn
+        self._pending_refresh = set()
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_pending_refresh)
+        
+        # In-flight background fetches by kind ('expenses' / 'savings')
+        self._fetch_threads: Dict[str, TaskThread] = {}
+        self._refetch_pending = set()
+        self._summary_stale = False
+        
+        # Contents of the last applied fetch per kind
+        self._record_signatures: Dict[str, tuple] = {}
+        
+        # Bumped whenever the records behind the summary may have changed
+        self._records_version = 0
+        
+        # (records version, text) of the last summary built
+        self._summary_cache: Optional[tuple] = None
+        
+        # Message boxes by icon, created on first use and reused afterwards
+        self._message_boxes: Dict[QMessageBox.Icon, QMessageBox] = {}
         
-        # Load initial data if business logic is available
-        if self.personal_finance:
-            self.refresh_data()
+        # Initial data is loaded when the page is first shown
+        self._initial_shown = False
+        
+        self._setup_ui()
         
         logger.info("Personal Finance page initialized")
     
@@ -277,6 +685,23 @@ class FinancePage(QWidget):
         self.personal_finance = personal_finance
         self.refresh_data()
     
+    def showEvent(self, event):
+        """Load data for the visible tab the first time the page is shown."""
+        super().showEvent(event)
+        if not self._initial_shown:
+            self._initial_shown = True
+            self._refresh_current_tab()
+    
+    def _refresh_current_tab(self):
+        """Refresh only the tab that is currently visible."""
+        index = self.tab_widget.currentIndex()
+        if index == self.EXPENSES_TAB:
+            self.refresh_expenses()
+        elif index == self.SAVINGS_TAB:
+            self.refresh_savings()
+        elif index == self.SUMMARY_TAB:
+            self.refresh_summary()
+    
     def _setup_ui(self):
         """Set up the main UI layout and components."""
         # Main layout
@@ -286,10 +711,7 @@ class FinancePage(QWidget):
         
         # Page title
         title_label = QLabel("Personal Finance Management")
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_title_font())
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(title_label)
         
@@ -297,10 +719,43 @@ class FinancePage(QWidget):
         self.tab_widget = QTabWidget()
         main_layout.addWidget(self.tab_widget)
         
-        # Add tabs
+        # Add tabs; savings and summary are built the first time they are shown
         self._setup_expenses_tab()
-        self._setup_savings_tab()
-        self._setup_summary_tab()
+        self.tab_widget.addTab(QWidget(), _TAB_SAVINGS)
+        self.tab_widget.addTab(QWidget(), _TAB_SUMMARY)
+        
+        self._tab_builders = {
+            self.SAVINGS_TAB: (self._setup_savings_tab, self.refresh_savings),
+            # The summary counts the fetched tables, so wait for in-flight fetches
+            self.SUMMARY_TAB: (self._setup_summary_tab, self._refresh_summary_when_idle),
+        }
+        self._tab_built = {
+            self.EXPENSES_TAB: True,
+            self.SAVINGS_TAB: False,
+            self.SUMMARY_TAB: False,
+        }
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+    
+    def _ensure_tab_built(self, index: int):
+        """Build a lazily created tab the first time it is shown."""
+        if self._tab_built.get(index, True):
+            return
+        
+        builder, refresher = self._tab_builders[index]
+        placeholder = self.tab_widget.widget(index)
+        
+        # Swap the placeholder for the real tab without re-entering this slot
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            builder(index)
+            self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+        
+        placeholder.deleteLater()
+        self._tab_built[index] = True
+        refresher()
     
     def _setup_expenses_tab(self):
         """Set up the expenses management tab."""
@@ -311,10 +766,7 @@ class FinancePage(QWidget):
         header_layout = QHBoxLayout()
         
         header_label = QLabel("Expense Management")
-        header_font = QFont()
-        header_font.setPointSize(14)
-        header_font.setBold(True)
-        header_label.setFont(header_font)
+        header_label.setFont(_header_font())
         header_layout.addWidget(header_label)
         
         header_layout.addStretch()
@@ -341,39 +793,42 @@ class FinancePage(QWidget):
         layout.addLayout(header_layout)
         
         # Expenses table
-        self.expenses_table = QTableWidget()
+        self.expenses_table = QTableView()
+        self._expense_model = FinanceTableModel(self.expenses_data, "Category", self)
+        self.expenses_table.setModel(self._expense_model)
         self.expenses_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.expenses_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.expenses_table.setAlternatingRowColors(True)
         self.expenses_table.setSortingEnabled(True)
         
-        # Table headers
-        headers = ["ID", "Date", "Amount", "Category", "Description", "Tags"]
-        self.expenses_table.setColumnCount(len(headers))
-        self.expenses_table.setHorizontalHeaderLabels(headers)
+        # Fixed-height rows: row geometry is computed, never measured per row
+        self.expenses_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.expenses_table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         
         # Hide ID column
         self.expenses_table.setColumnHidden(0, True)
         
         # Resize columns
         header = self.expenses_table.horizontalHeader()
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)  # Date
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Amount
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)  # Category
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)           # Description
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)  # Tags
+        # Content-sized columns are measured once per refresh rather than
+        # continuously, see _resize_table_columns
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)  # Date
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Interactive)  # Amount
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Interactive)  # Category
+        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)      # Description
+        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Interactive)  # Tags
         
         # Connect selection changes
         self.expenses_table.selectionModel().selectionChanged.connect(self._on_expense_selection_changed)
-        self.expenses_table.doubleClicked.connect(self._edit_expense)
+        self.expenses_table.doubleClicked.connect(self._edit_expense_at)
         
         layout.addWidget(self.expenses_table)
         
         # Add to tab widget
-        self.tab_widget.addTab(expenses_widget, "💸 Expenses")
+        self.tab_widget.addTab(expenses_widget, _TAB_EXPENSES)
     
-    def _setup_savings_tab(self):
-        """Set up the savings management tab."""
+    def _setup_savings_tab(self, index: int):
+        """Set up the savings management tab at the given tab index."""
         savings_widget = QWidget()
         layout = QVBoxLayout(savings_widget)
         
@@ -381,10 +836,7 @@ class FinancePage(QWidget):
         header_layout = QHBoxLayout()
         
         header_label = QLabel("Savings Management")
-        header_font = QFont()
-        header_font.setPointSize(14)
-        header_font.setBold(True)
-        header_label.setFont(header_font)
+        header_label.setFont(_header_font())
         header_layout.addWidget(header_label)
         
         header_layout.addStretch()
@@ -411,74 +863,61 @@ class FinancePage(QWidget):
         layout.addLayout(header_layout)
         
         # Savings table
-        self.savings_table = QTableWidget()
+        self.savings_table = QTableView()
+        self._savings_model = FinanceTableModel(self.savings_data, "Source", self)
+        self.savings_table.setModel(self._savings_model)
         self.savings_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.savings_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.savings_table.setAlternatingRowColors(True)
         self.savings_table.setSortingEnabled(True)
         
-        # Table headers
-        headers = ["ID", "Date", "Amount", "Source", "Description", "Tags"]
-        self.savings_table.setColumnCount(len(headers))
-        self.savings_table.setHorizontalHeaderLabels(headers)
+        # Fixed-height rows: row geometry is computed, never measured per row
+        self.savings_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.savings_table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         
         # Hide ID column
         self.savings_table.setColumnHidden(0, True)
         
         # Resize columns
         header = self.savings_table.horizontalHeader()
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)  # Date
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Amount
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)  # Source
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)           # Description
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)  # Tags
+        # Content-sized columns are measured once per refresh rather than
+        # continuously, see _resize_table_columns
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)  # Date
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Interactive)  # Amount
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Interactive)  # Source
+        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)      # Description
+        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Interactive)  # Tags
         
         # Connect selection changes
         self.savings_table.selectionModel().selectionChanged.connect(self._on_savings_selection_changed)
-        self.savings_table.doubleClicked.connect(self._edit_savings)
+        self.savings_table.doubleClicked.connect(self._edit_savings_at)
         
         layout.addWidget(self.savings_table)
         
         # Add to tab widget
-        self.tab_widget.addTab(savings_widget, "💰 Savings")
+        self.tab_widget.insertTab(index, savings_widget, _TAB_SAVINGS)
     
-    def _setup_summary_tab(self):
-        """Set up the financial summary tab."""
+    def _setup_summary_tab(self, index: int):
+        """Set up the financial summary tab at the given tab index."""
         summary_widget = QWidget()
         layout = QVBoxLayout(summary_widget)
         
         # Summary section header
         header_label = QLabel("Financial Summary")
-        header_font = QFont()
-        header_font.setPointSize(14)
-        header_font.setBold(True)
-        header_label.setFont(header_font)
+        header_label.setFont(_header_font())
         layout.addWidget(header_label)
         
-        # Summary content
-        self.summary_content = QLabel("Loading financial summary...")
-        self.summary_content.setStyleSheet("""
-            QLabel {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 8px;
-                padding: 20px;
-                margin: 10px;
-                font-family: monospace;
-                font-size: 12px;
-            }
-        """)
-        self.summary_content.setWordWrap(True)
-        self.summary_content.setAlignment(Qt.AlignmentFlag.AlignTop)
+        # Summary content; refreshes rewrite only the lines that changed
+        self.summary_content = ReportView("Loading financial summary...")
         layout.addWidget(self.summary_content)
         
         # Refresh button
         refresh_summary_btn = QPushButton("Refresh Summary")
-        refresh_summary_btn.clicked.connect(self.refresh_summary)
+        refresh_summary_btn.clicked.connect(self._force_refresh_summary)
         layout.addWidget(refresh_summary_btn)
         
         # Add to tab widget
-        self.tab_widget.addTab(summary_widget, "📊 Summary")
+        self.tab_widget.insertTab(index, summary_widget, _TAB_SUMMARY)
     
     def _on_expense_selection_changed(self):
         """Handle expense table selection changes."""
@@ -495,55 +934,51 @@ class FinancePage(QWidget):
     def _add_expense(self):
         """Add a new expense."""
         if not self.personal_finance:
-            QMessageBox.warning(self, "Error", "Personal Finance service not available")
+            self._show_warning("Error", "Personal Finance service not available")
             return
         
         dialog = AddExpenseDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             try:
                 data = dialog.get_expense_data()
-                self.personal_finance.add_expense(
+                expense_id = self.personal_finance.add_expense(
                     date=data['date'],
                     category=data['category'], 
                     amount=data['amount'],
                     note=data['description']
                 )
-                self.refresh_expenses()
-                QMessageBox.information(self, "Success", "Expense added successfully")
+                self._apply_record_change('expenses', expense_id, {
+                    'id': expense_id, 'date': data['date'], 'category': data['category'],
+                    'amount': data['amount'], 'note': data['description']
+                })
+                self._show_info("Success", "Expense added successfully")
                 logger.info(f"Added expense: {data['amount']} in {data['category']}")
                 
             except PersonalFinanceError as e:
-                QMessageBox.critical(self, "Error", f"Failed to add expense: {str(e)}")
+                self._show_error("Error", f"Failed to add expense: {str(e)}")
                 logger.error(f"Failed to add expense: {e}")
             except Exception as e:
-                QMessageBox.critical(self, "Error", f"Unexpected error: {str(e)}")
+                self._show_error("Error", f"Unexpected error: {str(e)}")
                 logger.error(f"Unexpected error adding expense: {e}")
     
     def _edit_expense(self):
         """Edit the selected expense."""
-        if not self.personal_finance:
-            QMessageBox.warning(self, "Error", "Personal Finance service not available")
-            return
-        
         selected_rows = self.expenses_table.selectionModel().selectedRows()
         if not selected_rows:
-            QMessageBox.information(self, "Info", "Please select an expense to edit")
+            self._show_info("Info", "Please select an expense to edit")
             return
         
-        row = selected_rows[0].row()
-        expense_id = int(self.expenses_table.item(row, 0).text())
-        
-        # Find the expense data
-        expense_data = None
-        for expense in self.expenses_data:
-            if expense['id'] == expense_id:
-                expense_data = expense
-                break
-        
-        if not expense_data:
-            QMessageBox.critical(self, "Error", "Expense data not found")
+        self._edit_expense_at(selected_rows[0])
+    
+    def _edit_expense_at(self, index: QModelIndex):
+        """Edit the expense shown at the given table index."""
+        if not self.personal_finance:
+            self._show_warning("Error", "Personal Finance service not available")
             return
         
+        expense_data = self.expenses_data.record(index.row())
+        expense_id = expense_data['id']
+        
         dialog = EditExpenseDialog(expense_data, self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             try:
@@ -555,31 +990,35 @@ class FinancePage(QWidget):
                     amount=data['amount'],
                     note=data['description']
                 )
-                self.refresh_expenses()
-                QMessageBox.information(self, "Success", "Expense updated successfully")
+                self._apply_record_change('expenses', expense_id, {
+                    'id': expense_id, 'date': data['date'], 'category': data['category'],
+                    'amount': data['amount'], 'note': data['description']
+                })
+                self._show_info("Success", "Expense updated successfully")
                 logger.info(f"Updated expense ID {expense_id}")
                 
             except PersonalFinanceError as e:
-                QMessageBox.critical(self, "Error", f"Failed to update expense: {str(e)}")
+                self._show_error("Error", f"Failed to update expense: {str(e)}")
                 logger.error(f"Failed to update expense: {e}")
             except Exception as e:
-                QMessageBox.critical(self, "Error", f"Unexpected error: {str(e)}")
+                self._show_error("Error", f"Unexpected error: {str(e)}")
                 logger.error(f"Unexpected error updating expense: {e}")
     
     def _delete_expense(self):
         """Delete the selected expense."""
         if not self.personal_finance:
-            QMessageBox.warning(self, "Error", "Personal Finance service not available")
+            self._show_warning("Error", "Personal Finance service not available")
             return
         
         selected_rows = self.expenses_table.selectionModel().selectedRows()
         if not selected_rows:
-            QMessageBox.information(self, "Info", "Please select an expense to delete")
+            self._show_info("Info", "Please select an expense to delete")
             return
         
         row = selected_rows[0].row()
-        expense_id = int(self.expenses_table.item(row, 0).text())
-        expense_desc = self.expenses_table.item(row, 4).text()
+        expense = self.expenses_data.record(row)
+        expense_id = expense['id']
+        expense_desc = expense.get('note', '')
         
         reply = QMessageBox.question(
             self, "Confirm Delete",
@@ -591,69 +1030,65 @@ class FinancePage(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 self.personal_finance.delete_expense(expense_id)
-                self.refresh_expenses()
-                QMessageBox.information(self, "Success", "Expense deleted successfully")
+                self._apply_record_change('expenses', expense_id, None)
+                self._show_info("Success", "Expense deleted successfully")
                 logger.info(f"Deleted expense ID {expense_id}")
                 
             except PersonalFinanceError as e:
-                QMessageBox.critical(self, "Error", f"Failed to delete expense: {str(e)}")
+                self._show_error("Error", f"Failed to delete expense: {str(e)}")
                 logger.error(f"Failed to delete expense: {e}")
             except Exception as e:
-                QMessageBox.critical(self, "Error", f"Unexpected error: {str(e)}")
+                self._show_error("Error", f"Unexpected error: {str(e)}")
                 logger.error(f"Unexpected error deleting expense: {e}")
     
     def _add_savings(self):
         """Add a new savings record."""
         if not self.personal_finance:
-            QMessageBox.warning(self, "Error", "Personal Finance service not available")
+            self._show_warning("Error", "Personal Finance service not available")
             return
         
         dialog = AddSavingsDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             try:
                 data = dialog.get_savings_data()
-                self.personal_finance.add_savings(
+                savings_id = self.personal_finance.add_savings(
                     date=data['date'],
                     source=data['source'],
                     amount=data['amount'],
                     note=data['description']
                 )
-                self.refresh_savings()
-                QMessageBox.information(self, "Success", "Savings added successfully")
+                self._apply_record_change('savings', savings_id, {
+                    'id': savings_id, 'date': data['date'], 'source': data['source'],
+                    'amount': data['amount'], 'note': data['description']
+                })
+                self._show_info("Success", "Savings added successfully")
                 logger.info(f"Added savings: {data['amount']} from {data['source']}")
                 
             except PersonalFinanceError as e:
-                QMessageBox.critical(self, "Error", f"Failed to add savings: {str(e)}")
+                self._show_error("Error", f"Failed to add savings: {str(e)}")
                 logger.error(f"Failed to add savings: {e}")
             except Exception as e:
-                QMessageBox.critical(self, "Error", f"Unexpected error: {str(e)}")
+                self._show_error("Error", f"Unexpected error: {str(e)}")
                 logger.error(f"Unexpected error adding savings: {e}")
     
     def _edit_savings(self):
         """Edit the selected savings record."""
-        if not self.personal_finance:
-            QMessageBox.warning(self, "Error", "Personal Finance service not available")
-            return
-        
         selected_rows = self.savings_table.selectionModel().selectedRows()
         if not selected_rows:
-            QMessageBox.information(self, "Info", "Please select a savings record to edit")
+            self._show_info("Info", "Please select a savings record to edit")
             return
         
-        row = selected_rows[0].row()
-        savings_id = int(self.savings_table.item(row, 0).text())
-        
-        # Find the savings data
-        savings_data = None
-        for savings in self.savings_data:
-            if savings['id'] == savings_id:
-                savings_data = savings
-                break
-        
-        if not savings_data:
-            QMessageBox.critical(self, "Error", "Savings data not found")
+        self._edit_savings_at(selected_rows[0])
+    
+    def _edit_savings_at(self, index: QModelIndex):
+        """Edit the savings record shown at the given table index."""
+        if not self.personal_finance:
+            self._show_warning("Error", "Personal Finance service not available")
             return
         
+        savings_data = self.savings_data.record(index.row())
+        savings_id = savings_data['id']
+        
         dialog = EditSavingsDialog(savings_data, self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             try:
@@ -665,31 +1100,35 @@ class FinancePage(QWidget):
                     amount=data['amount'],
                     note=data['description']
                 )
-                self.refresh_savings()
-                QMessageBox.information(self, "Success", "Savings updated successfully")
+                self._apply_record_change('savings', savings_id, {
+                    'id': savings_id, 'date': data['date'], 'source': data['source'],
+                    'amount': data['amount'], 'note': data['description']
+                })
+                self._show_info("Success", "Savings updated successfully")
                 logger.info(f"Updated savings ID {savings_id}")
                 
             except PersonalFinanceError as e:
-                QMessageBox.critical(self, "Error", f"Failed to update savings: {str(e)}")
+                self._show_error("Error", f"Failed to update savings: {str(e)}")
                 logger.error(f"Failed to update savings: {e}")
             except Exception as e:
-                QMessageBox.critical(self, "Error", f"Unexpected error: {str(e)}")
+                self._show_error("Error", f"Unexpected error: {str(e)}")
                 logger.error(f"Unexpected error updating savings: {e}")
     
     def _delete_savings(self):
         """Delete the selected savings record."""
         if not self.personal_finance:
-            QMessageBox.warning(self, "Error", "Personal Finance service not available")
+            self._show_warning("Error", "Personal Finance service not available")
             return
         
         selected_rows = self.savings_table.selectionModel().selectedRows()
         if not selected_rows:
-            QMessageBox.information(self, "Info", "Please select a savings record to delete")
+            self._show_info("Info", "Please select a savings record to delete")
             return
         
         row = selected_rows[0].row()
-        savings_id = int(self.savings_table.item(row, 0).text())
-        savings_desc = self.savings_table.item(row, 4).text()
+        savings = self.savings_data.record(row)
+        savings_id = savings['id']
+        savings_desc = savings.get('note', '')
         
         reply = QMessageBox.question(
             self, "Confirm Delete",
@@ -701,152 +1140,274 @@ class FinancePage(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 self.personal_finance.delete_savings(savings_id)
-                self.refresh_savings()
-                QMessageBox.information(self, "Success", "Savings deleted successfully")
+                self._apply_record_change('savings', savings_id, None)
+                self._show_info("Success", "Savings deleted successfully")
                 logger.info(f"Deleted savings ID {savings_id}")
                 
             except PersonalFinanceError as e:
-                QMessageBox.critical(self, "Error", f"Failed to delete savings: {str(e)}")
+                self._show_error("Error", f"Failed to delete savings: {str(e)}")
                 logger.error(f"Failed to delete savings: {e}")
             except Exception as e:
-                QMessageBox.critical(self, "Error", f"Unexpected error: {str(e)}")
+                self._show_error("Error", f"Unexpected error: {str(e)}")
                 logger.error(f"Unexpected error deleting savings: {e}")
     
-    def refresh_expenses(self):
-        """Refresh the expenses table with current data."""
-        if not self.personal_finance:
+    def _show_message(self, icon: QMessageBox.Icon, title: str, text: str):
+        """Show a modal message using the page's reusable box for the icon."""
+        box = self._message_boxes.get(icon)
+        if box is None:
+            box = QMessageBox(icon, title, text, QMessageBox.StandardButton.Ok, self)
+            self._message_boxes[icon] = box
+        else:
+            box.setWindowTitle(title)
+            box.setText(text)
+        box.exec()
+    
+    def _show_info(self, title: str, text: str):
+        """Show an information message."""
+        self._show_message(QMessageBox.Icon.Information, title, text)
+    
+    def _show_warning(self, title: str, text: str):
+        """Show a warning message."""
+        self._show_message(QMessageBox.Icon.Warning, title, text)
+    
+    def _show_error(self, title: str, text: str):
+        """Show an error message."""
+        self._show_message(QMessageBox.Icon.Critical, title, text)
+    
+    def _apply_record_change(self, kind: str, record_id: int,
+                             record: Optional[Dict[str, Any]]):
+        """
+        Apply a successful add, edit or delete to a table in place.
+        
+        Args:
+            kind: 'expenses' or 'savings'
+            record_id: Database ID of the changed record
+            record: New field values, or None if the record was deleted
+        """
+        if kind == 'expenses':
+            records, model = self.expenses_data, self._expense_model
+            update_buttons = self._on_expense_selection_changed
+        else:
+            records, model = self.savings_data, self._savings_model
+            update_buttons = self._on_savings_selection_changed
+        
+        row = records.row_of(record_id)
+        if record is None:
+            if row is not None:
+                model.remove_record(row)
+        elif row is None:
+            model.insert_record(record)
+        else:
+            model.update_record(row, record)
+        update_buttons()
+        
+        # The last fetched contents no longer describe the table
+        self._record_signatures.pop(kind, None)
+        
+        # A fetch started before the change may deliver stale rows; fetch again after it
+        if kind in self._fetch_threads:
+            self._refetch_pending.add(kind)
+        
+        self._schedule_refresh('summary')
+    
+    def _schedule_refresh(self, *kinds: str):
+        """
+        Queue a refresh of the given views ('expenses', 'savings', 'summary').
+        
+        Requests made before control returns to the event loop are merged,
+        so each view is refreshed at most once per burst of changes.
+        """
+        if 'summary' in kinds:
+            # Records changed, so any cached summary is out of date
+            self._records_version += 1
+        self._pending_refresh.update(kinds)
+        self._refresh_timer.start()
+    
+    def _do_pending_refresh(self):
+        """Run the queued refreshes, each view at most once."""
+        pending = self._pending_refresh
+        self._pending_refresh = set()
+        
+        if 'expenses' in pending:
+            self.refresh_expenses()
+        if 'savings' in pending and self._tab_built[self.SAVINGS_TAB]:
+            self.refresh_savings()
+        if 'summary' in pending and self._tab_built[self.SUMMARY_TAB]:
+            self._refresh_summary_when_idle()
+    
+    def _refresh_summary_when_idle(self):
+        """Refresh the summary now, or once in-flight table fetches have landed."""
+        if self._fetch_threads:
+            self._summary_stale = True
+        else:
+            self.refresh_summary()
+    
+    def _start_fetch(self, kind: str, fetch):
+        """
+        Run a record fetch on a background thread.
+        
+        Only one fetch per kind runs at a time; a request made while one is
+        in flight re-runs the fetch once the current one finishes, so the
+        table never shows rows older than the latest request.
+        """
+        if kind in self._fetch_threads:
+            self._refetch_pending.add(kind)
+            return
+        
+        thread = TaskThread(kind, fetch, parent=self)
+        thread.result_ready.connect(self._on_records_fetched)
+        thread.error_occurred.connect(self._on_fetch_error)
+        self._fetch_threads[kind] = thread
+        thread.start()
+    
+    def _finish_fetch(self, kind: str):
+        """Release a completed fetch and start any follow-up work."""
+        self._fetch_threads.pop(kind, None)
+        
+        if kind in self._refetch_pending:
+            self._refetch_pending.discard(kind)
+            if kind == 'expenses':
+                self.refresh_expenses()
+            else:
+                self.refresh_savings()
+        
+        if self._summary_stale and not self._fetch_threads:
+            self._summary_stale = False
+            self.refresh_summary()
+        
+        if not (self._fetch_threads or self._refetch_pending or self._pending_refresh):
+            self.data_updated.emit()
+    
+    def _on_records_fetched(self, kind: str, columns: Dict[str, List[Any]]):
+        """Apply record columns delivered by a background fetch."""
+        # Skip the model reset and repaint when nothing has changed
+        signature = tuple(tuple(values) for values in columns.values())
+        if signature == self._record_signatures.get(kind):
+            logger.debug(f"{kind.capitalize()} unchanged, skipping table refresh")
+            self._finish_fetch(kind)
             return
         
         try:
-            self.expenses_data = self.personal_finance.get_all_expenses()
-            self._populate_expenses_table()
-            logger.info(f"Refreshed expenses table with {len(self.expenses_data)} records")
+            if kind == 'expenses':
+                self.expenses_data = FinanceRecords.from_columns(columns, 'category')
+                with frozen(self.expenses_table):
+                    self._expense_model.set_records(self.expenses_data)
+                    self._resize_table_columns(self.expenses_table, self._CONTENT_COLUMNS)
+                self._on_expense_selection_changed()
+            else:
+                self.savings_data = FinanceRecords.from_columns(columns, 'source')
+                with frozen(self.savings_table):
+                    self._savings_model.set_records(self.savings_data)
+                    self._resize_table_columns(self.savings_table, self._CONTENT_COLUMNS)
+                self._on_savings_selection_changed()
+            
+            self._record_signatures[kind] = signature
+            self._records_version += 1
+            logger.info(f"Refreshed {kind} table with {len(columns['id'])} records")
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to refresh expenses: {str(e)}")
-            logger.error(f"Failed to refresh expenses: {e}")
+            self._show_error("Error", f"Failed to refresh {kind}: {str(e)}")
+            logger.error(f"Failed to refresh {kind}: {e}")
+        finally:
+            self._finish_fetch(kind)
+    
+    def _resize_table_columns(self, table: QTableView, columns):
+        """Size the given columns to their contents in a single pass."""
+        for column in columns:
+            table.resizeColumnToContents(column)
+    
+    def _on_fetch_error(self, kind: str, error_msg: str):
+        """Report a failed background fetch."""
+        self._show_error("Error", f"Failed to refresh {kind}: {error_msg}")
+        logger.error(f"Failed to refresh {kind}: {error_msg}")
+        self._finish_fetch(kind)
+    
+    def refresh_expenses(self):
+        """Refresh the expenses table with current data (fetched in the background)."""
+        if not self.personal_finance:
+            return
+        
+        self._start_fetch('expenses', self.personal_finance.get_expense_columns)
     
     def refresh_savings(self):
-        """Refresh the savings table with current data."""
+        """Refresh the savings table with current data (fetched in the background)."""
         if not self.personal_finance:
             return
         
-        try:
-            self.savings_data = self.personal_finance.get_all_savings()
-            self._populate_savings_table()
-            logger.info(f"Refreshed savings table with {len(self.savings_data)} records")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to refresh savings: {str(e)}")
-            logger.error(f"Failed to refresh savings: {e}")
+        self._start_fetch('savings', self.personal_finance.get_savings_columns)
     
     def refresh_summary(self):
         """Refresh the financial summary."""
         if not self.personal_finance:
-            self.summary_content.setText("Personal Finance service not available")
+            self.summary_content.set_report_text("Personal Finance service not available")
+            return
+        
+        if self._summary_cache is not None and self._summary_cache[0] == self._records_version:
+            self.summary_content.set_report_text(self._summary_cache[1])
             return
         
         try:
-            # Get summary data
-            total_expenses = self.personal_finance.get_expense_total()
-            total_savings = self.personal_finance.get_savings_total()
+            # Get summary data; the net position carries both totals
             net_position_data = self.personal_finance.get_net_position()
+            total_expenses = net_position_data.get('total_expenses', 0)
+            total_savings = net_position_data.get('total_savings', 0)
             net_position = net_position_data.get('net_position', 0)
             
             # Get breakdown data
             expense_breakdown = self.personal_finance.get_expense_breakdown_by_category()
-            # Create savings breakdown manually since method doesn't exist
-            savings_breakdown = {}
             savings_data = self.personal_finance.get_all_savings()
-            for savings in savings_data:
-                source = savings.get('source', 'Unknown')
-                amount = savings.get('amount', 0)
-                savings_breakdown[source] = savings_breakdown.get(source, 0) + amount
+            savings_breakdown = self.personal_finance.get_savings_breakdown_by_source(
+                savings=savings_data
+            )
             
-            # Format summary text
-            summary_text = f"""FINANCIAL SUMMARY
-============================================
-
-TOTALS:
-• Total Expenses: ${total_expenses:,.2f}
-• Total Savings:  ${total_savings:,.2f}
-• Net Position:   ${net_position:,.2f}
-
-EXPENSE BREAKDOWN BY CATEGORY:
-"""
-            for category, amount in expense_breakdown.items():
-                percentage = (amount / total_expenses * 100) if total_expenses > 0 else 0
-                summary_text += f"• {category:<15}: ${amount:>8,.2f} ({percentage:>5.1f}%)\n"
+            # Format summary text as a list of lines joined once
+            lines = [
+                "FINANCIAL SUMMARY",
+                "============================================",
+                "",
+                "TOTALS:",
+                f"• Total Expenses: ${total_expenses:,.2f}",
+                f"• Total Savings:  ${total_savings:,.2f}",
+                f"• Net Position:   ${net_position:,.2f}",
+                "",
+                "EXPENSE BREAKDOWN BY CATEGORY:",
+            ]
+            lines.extend(_breakdown_lines(expense_breakdown, total_expenses))
+            lines += ["", "SAVINGS BREAKDOWN BY SOURCE:"]
+            lines.extend(_breakdown_lines(savings_breakdown, total_savings))
+            lines += [
+                "",
+                "RECORD COUNTS:",
+                f"• Expense Records: {len(self.expenses_data)}",
+                f"• Savings Records: {len(savings_data)}",
+                "",
+            ]
+            summary_text = "\n".join(lines)
             
-            summary_text += "\nSAVINGS BREAKDOWN BY SOURCE:\n"
-            for source, amount in savings_breakdown.items():
-                percentage = (amount / total_savings * 100) if total_savings > 0 else 0
-                summary_text += f"• {source:<15}: ${amount:>8,.2f} ({percentage:>5.1f}%)\n"
-            
-            summary_text += f"\nRECORD COUNTS:\n"
-            summary_text += f"• Expense Records: {len(self.expenses_data)}\n"
-            summary_text += f"• Savings Records: {len(self.savings_data)}\n"
-            
-            self.summary_content.setText(summary_text)
+            self._summary_cache = (self._records_version, summary_text)
+            self.summary_content.set_report_text(summary_text)
             logger.info("Refreshed financial summary")
             
         except Exception as e:
             error_text = f"Error loading financial summary: {str(e)}"
-            self.summary_content.setText(error_text)
+            self.summary_content.set_report_text(error_text)
             logger.error(f"Failed to refresh summary: {e}")
     
-    def _populate_expenses_table(self):
-        """Populate the expenses table with current data."""
-        self.expenses_table.setRowCount(len(self.expenses_data))
-        
-        for row, expense in enumerate(self.expenses_data):
-            # ID (hidden)
-            self.expenses_table.setItem(row, 0, QTableWidgetItem(str(expense['id'])))
-            
-            # Date
-            self.expenses_table.setItem(row, 1, QTableWidgetItem(expense['date']))
-            
-            # Amount
-            amount_item = QTableWidgetItem(f"${expense['amount']:.2f}")
-            amount_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.expenses_table.setItem(row, 2, amount_item)
-            
-            # Category
-            self.expenses_table.setItem(row, 3, QTableWidgetItem(expense['category']))
-            
-            # Description (stored as 'note' in database)
-            self.expenses_table.setItem(row, 4, QTableWidgetItem(expense.get('note', '')))
-            
-            # Tags (not stored in database, show empty)
-            self.expenses_table.setItem(row, 5, QTableWidgetItem(''))
-    
-    def _populate_savings_table(self):
-        """Populate the savings table with current data."""
-        self.savings_table.setRowCount(len(self.savings_data))
-        
-        for row, savings in enumerate(self.savings_data):
-            # ID (hidden)
-            self.savings_table.setItem(row, 0, QTableWidgetItem(str(savings['id'])))
-            
-            # Date
-            self.savings_table.setItem(row, 1, QTableWidgetItem(savings['date']))
-            
-            # Amount
-            amount_item = QTableWidgetItem(f"${savings['amount']:.2f}")
-            amount_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.savings_table.setItem(row, 2, amount_item)
-            
-            # Source
-            self.savings_table.setItem(row, 3, QTableWidgetItem(savings['source']))
-            
-            # Description (stored as 'note' in database)
-            self.savings_table.setItem(row, 4, QTableWidgetItem(savings.get('note', '')))
-            
-            # Tags (not stored in database, show empty)
-            self.savings_table.setItem(row, 5, QTableWidgetItem(''))
+    def _force_refresh_summary(self):
+        """Rebuild the summary from the database, ignoring the cached text."""
+        self._summary_cache = None
+        self._refresh_summary_when_idle()
     
     def refresh_data(self):
-        """Refresh all data (expenses, savings, and summary)."""
-        self.refresh_expenses()
-        self.refresh_savings()
-        self.refresh_summary()
-        self.data_updated.emit()
-        logger.info("Refreshed all Personal Finance data") 
\ No newline at end of file
+        """
+        Refresh all data (expenses, savings, and summary).
+        
+        Calls made in quick succession (menu, toolbar, signals) are merged
+        into one pass; tabs that have not been built yet are refreshed when
+        first shown.
+        """
+        if not self.personal_finance:
+            self.data_updated.emit()
+            return
+        
+        self._schedule_refresh('expenses', 'savings', 'summary')
+        logger.info("Queued refresh of all Personal Finance data") 
\ No newline at end of file
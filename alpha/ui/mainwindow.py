@@ -13,16 +13,110 @@ from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QAction, QIcon, QFont
 import sys
 import logging
+from functools import partial
+from typing import Optional
 
 # Import page modules
 from .finance_page import FinancePage
 from .trading_page import TradingPage
 from .positions_page import PositionsPage
 from .visualizations_page import VisualizationsPage
+from .workers import TaskThread
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Application style sheet, parsed by Qt when applied
+_MAINWINDOW_QSS = """
+    QMainWindow {
+        background-color: #ffffff;
+    }
+    QTabWidget::pane {
+        border: 1px solid #c0c0c0;
+        background-color: #ffffff;
+    }
+    QTabBar::tab {
+        background-color: #f0f0f0;
+        border: 1px solid #c0c0c0;
+        padding: 8px 16px;
+        margin-right: 2px;
+    }
+    QTabBar::tab:selected {
+        background-color: #ffffff;
+        border-bottom-color: #ffffff;
+    }
+    QTabBar::tab:hover {
+        background-color: #e0e0e0;
+    }
+"""
+
+# Dashboard style sheets
+_SUBTITLE_QSS = "color: #666666; margin-bottom: 20px;"
+_WELCOME_QSS = """
+    QLabel {
+        background-color: #f8f9fa;
+        border: 1px solid #dee2e6;
+        border-radius: 8px;
+        padding: 20px;
+        margin: 20px;
+        line-height: 1.6;
+    }
+"""
+_STATUS_INFO_QSS = "color: #6c757d; font-style: italic; margin-top: 20px;"
+
+# Shared dashboard fonts, created on first use (a QApplication must exist by then)
+_DASHBOARD_TITLE_FONT: Optional[QFont] = None
+_DASHBOARD_SUBTITLE_FONT: Optional[QFont] = None
+
+
+def _dashboard_title_font() -> QFont:
+    """Return the shared dashboard title font."""
+    global _DASHBOARD_TITLE_FONT
+    if _DASHBOARD_TITLE_FONT is None:
+        _DASHBOARD_TITLE_FONT = QFont()
+        _DASHBOARD_TITLE_FONT.setPointSize(24)
+        _DASHBOARD_TITLE_FONT.setBold(True)
+    return _DASHBOARD_TITLE_FONT
+
+
+def _dashboard_subtitle_font() -> QFont:
+    """Return the shared dashboard subtitle font."""
+    global _DASHBOARD_SUBTITLE_FONT
+    if _DASHBOARD_SUBTITLE_FONT is None:
+        _DASHBOARD_SUBTITLE_FONT = QFont()
+        _DASHBOARD_SUBTITLE_FONT.setPointSize(14)
+    return _DASHBOARD_SUBTITLE_FONT
+
+
+def _create_backend():
+    """
+    Open the database and create the business logic services.
+    
+    Runs in a background thread; touches no widgets.
+    
+    Returns:
+        tuple: (database, personal_finance, trading_journal, open_positions)
+    """
+    # Import business logic modules
+    from db import AlphaDatabase
+    from finance import PersonalFinance
+    from trading import TradingJournal
+    from positions import OpenPositions
+    
+    # Initialize database
+    database = AlphaDatabase()
+    logger.info("Database initialized")
+    
+    # Initialize business logic services
+    personal_finance = PersonalFinance(database)
+    trading_journal = TradingJournal(database)
+    open_positions = OpenPositions(database)
+    logger.info("Personal Finance service initialized")
+    logger.info("Trading Journal service initialized")
+    logger.info("Open Positions service initialized")
+    
+    return database, personal_finance, trading_journal, open_positions
+
 
 class MainWindow(QMainWindow):
     """
@@ -60,32 +154,49 @@ class MainWindow(QMainWindow):
         logger.info("Main window initialized successfully")
     
     def _init_business_logic(self):
-        """Initialize business logic components."""
-        try:
-            # Import business logic modules
-            from db import AlphaDatabase
-            from finance import PersonalFinance
-            from trading import TradingJournal
-            from positions import OpenPositions
-            
-            # Initialize database
-            self.database = AlphaDatabase()
-            logger.info("Database initialized")
-            
-            # Initialize business logic services
-            self.personal_finance = PersonalFinance(self.database)
-            self.trading_journal = TradingJournal(self.database)
-            self.open_positions = OpenPositions(self.database)
-            logger.info("Personal Finance service initialized")
-            logger.info("Trading Journal service initialized")
-            logger.info("Open Positions service initialized")
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize business logic: {e}")
-            self.database = None
-            self.personal_finance = None
-            self.trading_journal = None
-            self.open_positions = None
+        """
+        Start initializing business logic components in the background.
+        
+        The window is shown straight away; pages see no services until
+        _on_backend_ready hands them over.
+        """
+        self.database = None
+        self.personal_finance = None
+        self.trading_journal = None
+        self.open_positions = None
+        
+        backend_thread = TaskThread('backend', _create_backend, parent=self)
+        backend_thread.result_ready.connect(self._on_backend_ready)
+        backend_thread.error_occurred.connect(self._on_backend_failed)
+        backend_thread.start()
+    
+    def _on_backend_ready(self, name: str, backend):
+        """Store the initialized services and pass them to built pages."""
+        self.database, self.personal_finance, self.trading_journal, self.open_positions = backend
+        
+        # Pages built before the backend was ready load their data now
+        if self.finance_page:
+            self.finance_page.set_personal_finance(self.personal_finance)
+        if self.trading_page:
+            self.trading_page.set_trading_journal(self.trading_journal)
+        if self.positions_page:
+            self.positions_page.set_open_positions(self.open_positions)
+        if self.visualizations_page:
+            self.visualizations_page.set_business_logic(
+                personal_finance=self.personal_finance,
+                trading_journal=self.trading_journal,
+                open_positions=self.open_positions
+            )
+        
+        self.connection_status.setText("Database: Connected")
+        self.connection_status.setStyleSheet("color: green; font-weight: bold;")
+    
+    def _on_backend_failed(self, name: str, error_msg: str):
+        """Report that the business logic could not be initialized."""
+        logger.error(f"Failed to initialize business logic: {error_msg}")
+        self.connection_status.setText("Database: Unavailable")
+        self.connection_status.setStyleSheet("color: red; font-weight: bold;")
+        self.status_bar.showMessage(f"Failed to open database: {error_msg}")
     
     def _setup_ui(self):
         """Set up the main user interface with tab widget."""
@@ -114,33 +225,82 @@ class MainWindow(QMainWindow):
         self.tab_widget.currentChanged.connect(self._on_tab_changed)
     
     def _setup_tabs(self):
-        """Create and add all application tabs."""
+        """Create the dashboard and add placeholders for the page tabs."""
         # Dashboard tab
         self.dashboard_widget = self._create_dashboard_widget()
         self.tab_widget.addTab(self.dashboard_widget, "📊 Dashboard")
         
+        # Pages are built the first time their tab is shown
+        self.finance_page = None
+        self.trading_page = None
+        self.positions_page = None
+        self.visualizations_page = None
+        self._page_factories = {}
+        
+        # Built pages, in the order they are refreshed
+        self._refreshables = []
+        
         # Personal Finance tab
-        self.finance_page = FinancePage(self.personal_finance)
-        self.tab_widget.addTab(self.finance_page, "💰 Personal Finance")
+        self._add_lazy_tab("💰 Personal Finance", 'finance_page',
+                           lambda: FinancePage(self.personal_finance))
         
         # Trading Journal tab
-        self.trading_page = TradingPage(self.trading_journal)
-        self.tab_widget.addTab(self.trading_page, "📈 Trading Journal")
+        self._add_lazy_tab("📈 Trading Journal", 'trading_page',
+                           lambda: TradingPage(self.trading_journal))
         
         # Open Positions tab
-        self.positions_page = PositionsPage(self.open_positions)
-        self.tab_widget.addTab(self.positions_page, "🎯 Open Positions")
+        self._add_lazy_tab("🎯 Open Positions", 'positions_page',
+                           lambda: PositionsPage(self.open_positions))
         
         # Visualizations tab
-        self.visualizations_page = VisualizationsPage(
-            personal_finance=self.personal_finance,
-            trading_journal=self.trading_journal,
-            open_positions=self.open_positions
-        )
-        self.tab_widget.addTab(self.visualizations_page, "📊 Analytics")
+        self._add_lazy_tab("📊 Analytics", 'visualizations_page',
+                           lambda: VisualizationsPage(
+                               personal_finance=self.personal_finance,
+                               trading_journal=self.trading_journal,
+                               open_positions=self.open_positions
+                           ))
         
         logger.info("All tabs created and added to tab widget")
     
+    def _add_lazy_tab(self, title: str, attr_name: str, factory):
+        """
+        Add a placeholder tab whose page is built on first view.
+        
+        Args:
+            title: Tab title
+            attr_name: Window attribute that will hold the built page
+            factory: Callable returning the page widget
+        """
+        placeholder = QWidget()
+        # Keyed by widget rather than index because tabs can be moved
+        self._page_factories[placeholder] = (attr_name, factory)
+        self.tab_widget.addTab(placeholder, title)
+    
+    def _ensure_page_built(self, index: int):
+        """Replace the placeholder at the given tab index with its page."""
+        placeholder = self.tab_widget.widget(index)
+        entry = self._page_factories.pop(placeholder, None)
+        if entry is None:
+            return
+        
+        attr_name, factory = entry
+        page = factory()
+        setattr(self, attr_name, page)
+        self._refreshables.append(page)
+        
+        # Swap the page in without re-entering the tab change handler
+        title = self.tab_widget.tabText(index)
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, page, title)
+            self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+        
+        logger.info(f"Built {title} page on first view")
+    
     def _create_dashboard_widget(self):
         """Create the dashboard overview page."""
         dashboard = QWidget()
@@ -150,19 +310,14 @@ class MainWindow(QMainWindow):
         # Title
         title = QLabel("Alpha Dashboard")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_font = QFont()
-        title_font.setPointSize(24)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(_dashboard_title_font())
         layout.addWidget(title)
         
         # Subtitle
         subtitle = QLabel("Personal Finance Management System")
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle_font = QFont()
-        subtitle_font.setPointSize(14)
-        subtitle.setFont(subtitle_font)
-        subtitle.setStyleSheet("color: #666666; margin-bottom: 20px;")
+        subtitle.setFont(_dashboard_subtitle_font())
+        subtitle.setStyleSheet(_SUBTITLE_QSS)
         layout.addWidget(subtitle)
         
         # Welcome message
@@ -175,22 +330,13 @@ class MainWindow(QMainWindow):
         )
         welcome.setAlignment(Qt.AlignmentFlag.AlignCenter)
         welcome.setWordWrap(True)
-        welcome.setStyleSheet("""
-            QLabel {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 8px;
-                padding: 20px;
-                margin: 20px;
-                line-height: 1.6;
-            }
-        """)
+        welcome.setStyleSheet(_WELCOME_QSS)
         layout.addWidget(welcome)
         
         # Status info (placeholder for future dashboard content)
         status_info = QLabel("Dashboard content will be added in future updates")
         status_info.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        status_info.setStyleSheet("color: #6c757d; font-style: italic; margin-top: 20px;")
+        status_info.setStyleSheet(_STATUS_INFO_QSS)
         layout.addWidget(status_info)
         
         return dashboard
@@ -225,7 +371,7 @@ class MainWindow(QMainWindow):
         for i in range(5):  # We have 5 tabs
             action = QAction(f"Go to Tab {i+1}", self)
             action.setShortcut(f"Ctrl+{i+1}")
-            action.triggered.connect(lambda checked, idx=i: self.tab_widget.setCurrentIndex(idx))
+            action.triggered.connect(partial(self._goto_tab, i))
             view_menu.addAction(action)
         
         # Help menu
@@ -251,25 +397,29 @@ class MainWindow(QMainWindow):
         
         # Quick navigation actions
         dashboard_action = QAction("Dashboard", self)
-        dashboard_action.triggered.connect(lambda: self.tab_widget.setCurrentIndex(0))
+        dashboard_action.triggered.connect(partial(self._goto_tab, 0))
         toolbar.addAction(dashboard_action)
         
         finance_action = QAction("Finance", self)
-        finance_action.triggered.connect(lambda: self.tab_widget.setCurrentIndex(1))
+        finance_action.triggered.connect(partial(self._goto_tab, 1))
         toolbar.addAction(finance_action)
         
         trading_action = QAction("Trading", self)
-        trading_action.triggered.connect(lambda: self.tab_widget.setCurrentIndex(2))
+        trading_action.triggered.connect(partial(self._goto_tab, 2))
         toolbar.addAction(trading_action)
         
         positions_action = QAction("Positions", self)
-        positions_action.triggered.connect(lambda: self.tab_widget.setCurrentIndex(3))
+        positions_action.triggered.connect(partial(self._goto_tab, 3))
         toolbar.addAction(positions_action)
         
         analytics_action = QAction("Analytics", self)
-        analytics_action.triggered.connect(lambda: self.tab_widget.setCurrentIndex(4))
+        analytics_action.triggered.connect(partial(self._goto_tab, 4))
         toolbar.addAction(analytics_action)
     
+    def _goto_tab(self, index: int, checked: bool = False):
+        """Switch to the tab at the given index (slot for navigation actions)."""
+        self.tab_widget.setCurrentIndex(index)
+    
     def _setup_status_bar(self):
         """Set up the status bar."""
         self.status_bar = QStatusBar()
@@ -279,35 +429,14 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage("Ready - Alpha Personal Finance Manager")
         
         # Add permanent widgets for status info
-        self.connection_status = QLabel("Database: Connected")
-        self.connection_status.setStyleSheet("color: green; font-weight: bold;")
+        self.connection_status = QLabel("Database: Connecting...")
+        self.connection_status.setStyleSheet("color: #6c757d; font-weight: bold;")
         self.status_bar.addPermanentWidget(self.connection_status)
     
     def _setup_window_state(self):
         """Set up initial window state and appearance."""
         # Set application style
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #ffffff;
-            }
-            QTabWidget::pane {
-                border: 1px solid #c0c0c0;
-                background-color: #ffffff;
-            }
-            QTabBar::tab {
-                background-color: #f0f0f0;
-                border: 1px solid #c0c0c0;
-                padding: 8px 16px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: #ffffff;
-                border-bottom-color: #ffffff;
-            }
-            QTabBar::tab:hover {
-                background-color: #e0e0e0;
-            }
-        """)
+        self.setStyleSheet(_MAINWINDOW_QSS)
         
         # Center the window on screen
         self._center_on_screen()
@@ -324,6 +453,8 @@ class MainWindow(QMainWindow):
     
     def _on_tab_changed(self, index):
         """Handle tab change events."""
+        self._ensure_page_built(index)
+        
         tab_names = ["Dashboard", "Personal Finance", "Trading Journal", "Open Positions", "Analytics"]
         if 0 <= index < len(tab_names):
             self.status_bar.showMessage(f"Switched to {tab_names[index]} tab")
@@ -333,29 +464,20 @@ class MainWindow(QMainWindow):
         """Refresh all data across the application."""
         self.status_bar.showMessage("Refreshing data...")
         
-        try:
-            # Refresh Personal Finance page
-            if hasattr(self, 'finance_page') and self.finance_page:
-                self.finance_page.refresh_data()
-            
-            # Refresh Trading Journal page
-            if hasattr(self, 'trading_page') and self.trading_page:
-                self.trading_page.refresh_data()
-            
-            # Refresh Open Positions page
-            if hasattr(self, 'positions_page') and self.positions_page:
-                self.positions_page.refresh_data()
-            
-            # Refresh Visualizations page
-            if hasattr(self, 'visualizations_page') and self.visualizations_page:
-                self.visualizations_page.refresh_data()
-            
+        failures = 0
+        for page in self._refreshables:
+            try:
+                page.refresh_data()
+            except Exception as e:
+                failures += 1
+                logger.warning(f"Failed to refresh {type(page).__name__}: {e}")
+        
+        if failures:
+            self.status_bar.showMessage(f"Refresh failed for {failures} page(s)")
+            logger.error(f"Data refresh failed for {failures} page(s)")
+        else:
             self.status_bar.showMessage("Data refreshed successfully")
             logger.info("Data refresh completed")
-            
-        except Exception as e:
-            self.status_bar.showMessage(f"Refresh failed: {str(e)}")
-            logger.error(f"Data refresh failed: {e}")
     
     def _show_about(self):
         """Show about dialog."""
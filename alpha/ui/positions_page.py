@@ -8,24 +8,514 @@ Integrates with OpenPositions business logic while maintaining separation of con
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTableWidget, QTableWidgetItem, QTabWidget, QGroupBox, 
+    QTableView, QTabWidget, QGroupBox, 
     QFormLayout, QLineEdit, QComboBox, QDateEdit, QDoubleSpinBox, 
     QTextEdit, QSplitter, QProgressBar, QScrollArea, QMessageBox,
     QHeaderView, QAbstractItemView, QFrame, QDialog
 )
-from PySide6.QtCore import Qt, QTimer, Signal
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtCore import (
+    Qt, QDate, QTimer, QElapsedTimer, QSettings, Signal, QSignalBlocker, QAbstractTableModel, QModelIndex,
+    QSortFilterProxyModel
+)
+from PySide6.QtGui import QFont, QColor, QBrush, QAction, QGuiApplication
 import logging
-from datetime import datetime
+from datetime import datetime, time
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 
 # Import business logic
-from positions import OpenPositions, PositionsError
+from positions import ASSET_TYPES, OpenPositions, PositionsError, PositionsSnapshot
 from db import AlphaDatabase
 
+from .views import ReportView, frozen
+from .workers import TaskThread
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Alignment for numeric cells, combined once rather than per cell
+_RIGHT_VCENTER = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+# Cell backgrounds for gains, losses and missing prices
+_GAIN_BRUSH = QBrush(QColor(220, 255, 220))     # Light green
+_LOSS_BRUSH = QBrush(QColor(255, 220, 220))     # Light red
+_MISSING_BRUSH = QBrush(QColor(240, 240, 240))  # Light gray
+
+# Background by sign of a gain/loss figure: 1 gain, -1 loss, 0 unchanged
+_BRUSH_BY_SIGN = {1: _GAIN_BRUSH, -1: _LOSS_BRUSH, 0: None}
+
+# Combo box index of each asset type in the add/edit dialogs
+_ASSET_TYPE_INDEX = {asset_type: index for index, asset_type in enumerate(ASSET_TYPES)}
+
+# Tab titles, shared by the placeholder and the built tab
+_TAB_POSITIONS = "🎯 Positions"
+_TAB_PORTFOLIO = "📊 Portfolio"
+_TAB_PERFORMANCE = "📈 Performance"
+
+# Role under which the model exposes raw (unformatted) values for sorting
+_SORT_ROLE = Qt.ItemDataRole.UserRole
+
+# Auto-refresh intervals: fast while the US market trades, slow otherwise
+_MARKET_HOURS_INTERVAL_MS = 15 * 1000
+_AFTER_HOURS_INTERVAL_MS = 5 * 60 * 1000
+_WEEKEND_INTERVAL_MS = 30 * 60 * 1000
+
+# QSettings key remembering whether auto-refresh was left on
+_AUTO_REFRESH_SETTING = "positions/auto_refresh"
+
+# Regular US trading session, in New York time
+_MARKET_OPEN = time(9, 30)
+_MARKET_CLOSE = time(16, 0)
+
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+    _MARKET_TZ = ZoneInfo("America/New_York")
+except (ImportError, ZoneInfoNotFoundError):
+    # No time zone database (e.g. Windows without tzdata): use local time
+    _MARKET_TZ = None
+
+
+def _refresh_interval_ms(trades_around_the_clock: bool = False) -> int:
+    """
+    Return the auto-refresh interval for the current market regime.
+    
+    Args:
+        trades_around_the_clock: True if any position (e.g. crypto) keeps
+            trading outside the regular session
+    """
+    if trades_around_the_clock:
+        return _MARKET_HOURS_INTERVAL_MS
+    
+    now = datetime.now(_MARKET_TZ)
+    if now.weekday() >= 5:
+        return _WEEKEND_INTERVAL_MS
+    if _MARKET_OPEN <= now.time() < _MARKET_CLOSE:
+        return _MARKET_HOURS_INTERVAL_MS
+    return _AFTER_HOURS_INTERVAL_MS
+
+
+@lru_cache(maxsize=4096)
+def _format_last_updated(last_updated: str) -> str:
+    """
+    Format an ISO timestamp as HH:MM:SS, or return the text unchanged.
+    
+    Cached: a refresh stamps many positions with few distinct timestamps,
+    and unchanged rows keep theirs across refreshes.
+    """
+    if last_updated != 'Never' and 'T' in last_updated:
+        try:
+            # Our own timestamps carry no 'Z'; only rewrite the ones that do
+            iso = last_updated[:-1] + '+00:00' if last_updated.endswith('Z') else last_updated
+            return datetime.fromisoformat(iso).strftime('%H:%M:%S')
+        except ValueError:
+            pass
+    return last_updated
+
+
+def _row_runs(rows: List[int]):
+    """Yield (first, last) for each run of consecutive numbers in a sorted list of rows."""
+    if not rows:
+        return
+    run_start = previous = rows[0]
+    for row in rows[1:]:
+        if row != previous + 1:
+            yield run_start, previous
+            run_start = row
+        previous = row
+    yield run_start, previous
+
+
+def _sign_brush(value: float) -> Optional[QBrush]:
+    """Return the gain/loss background for a signed value, None for zero."""
+    return _BRUSH_BY_SIGN[(value > 0) - (value < 0)]
+
+
+class PositionsModel(QAbstractTableModel):
+    """
+    Read-only table model over a list of position dictionaries.
+    
+    Cells are formatted on demand from the position dicts, so the view only
+    asks for the rows it actually paints and no per-cell items are built.
+    A row's texts are formatted together the first time it is painted and
+    reused on later repaints; a live-price update re-formats only the cells
+    whose values moved. Raw values are exposed under the sort role so
+    sorting stays numeric.
+    """
+    
+    HEADERS = (
+        "ID", "Symbol", "Asset Type", "Entry Date", "Entry Price", "Quantity",
+        "Entry Value", "Live Price", "Current Value", "P&L", "P&L %", "Price Change %", "Last Updated"
+    )
+    
+    ID_COLUMN = 0
+    SYMBOL_COLUMN = 1
+    ASSET_TYPE_COLUMN = 2
+    ENTRY_DATE_COLUMN = 3
+    ENTRY_PRICE_COLUMN = 4
+    QUANTITY_COLUMN = 5
+    ENTRY_VALUE_COLUMN = 6
+    LIVE_PRICE_COLUMN = 7
+    CURRENT_VALUE_COLUMN = 8
+    PNL_COLUMN = 9
+    PNL_PERCENT_COLUMN = 10
+    PRICE_CHANGE_COLUMN = 11
+    LAST_UPDATED_COLUMN = 12
+    
+    # Dictionary key behind each optional numeric column and its format
+    _OPTIONAL_COLUMNS = {
+        LIVE_PRICE_COLUMN: ('live_price', "${:.4f}"),
+        CURRENT_VALUE_COLUMN: ('current_value', "${:,.2f}"),
+        PNL_COLUMN: ('unrealized_pnl', "${:+,.2f}"),
+        PNL_PERCENT_COLUMN: ('unrealized_pnl_percent', "{:+.2f}%"),
+        PRICE_CHANGE_COLUMN: ('price_change_percent', "{:+.2f}%"),
+    }
+    
+    # Columns showing each position field; a change to the field repaints them
+    _COLUMNS_BY_KEY = {
+        'id': (ID_COLUMN,),
+        'symbol': (SYMBOL_COLUMN,),
+        'asset_type': (ASSET_TYPE_COLUMN,),
+        'entry_date': (ENTRY_DATE_COLUMN,),
+        'entry_price': (ENTRY_PRICE_COLUMN, ENTRY_VALUE_COLUMN),
+        'quantity': (QUANTITY_COLUMN, ENTRY_VALUE_COLUMN),
+        'entry_value': (ENTRY_VALUE_COLUMN,),
+        'live_price': (LIVE_PRICE_COLUMN,),
+        'current_value': (CURRENT_VALUE_COLUMN,),
+        'unrealized_pnl': (PNL_COLUMN,),
+        'unrealized_pnl_percent': (PNL_PERCENT_COLUMN,),
+        'price_change_percent': (LIVE_PRICE_COLUMN, PRICE_CHANGE_COLUMN),
+        'last_updated': (LAST_UPDATED_COLUMN,),
+    }
+    
+    # Roles that can change when a position's values change; the sort role
+    # is included so the proxy re-sorts when a sorted column moves
+    _CHANGED_ROLES = [
+        Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.TextAlignmentRole,
+        Qt.ItemDataRole.BackgroundRole, _SORT_ROLE
+    ]
+    
+    # Rows added per event loop pass when loading a large position list
+    BATCH_SIZE = 200
+    
+    def __init__(self, parent=None):
+        """Initialize an empty model."""
+        super().__init__(parent)
+        self._rows: List[Dict[str, Any]] = []
+        
+        # Formatted cell texts per row, filled in as rows are first painted
+        self._row_texts: List[Optional[tuple]] = []
+        
+        # Upper-cased symbol per row, for case-insensitive filtering
+        self._symbol_keys: List[str] = []
+        
+        # Bumped on every reset so batches of a superseded load are dropped
+        self._load_generation = 0
+        
+        # (positions, next index) of a batched load still being appended
+        self._pending_load: Optional[tuple] = None
+    
+    def set_positions(self, positions: List[Dict[str, Any]]):
+        """
+        Replace all positions.
+        
+        The model is reset with the first batch of rows so the view can
+        paint right away; the remaining rows are appended in batches from
+        the event loop, keeping the UI responsive for very large lists.
+        """
+        self._load_generation += 1
+        self._pending_load = None
+        first_batch = positions[:self.BATCH_SIZE]
+        
+        self.beginResetModel()
+        self._rows = first_batch
+        self._row_texts = [None] * len(first_batch)
+        self._symbol_keys = [self._symbol_key(position) for position in first_batch]
+        self.endResetModel()
+        
+        if len(positions) > len(first_batch):
+            self._schedule_batch(positions, len(first_batch))
+    
+    def _schedule_batch(self, positions: List[Dict[str, Any]], start: int):
+        """Append the next batch of a load from the event loop."""
+        generation = self._load_generation
+        self._pending_load = (positions, start)
+        QTimer.singleShot(0, lambda: self._append_batch(positions, start, generation))
+    
+    def _append_batch(self, positions: List[Dict[str, Any]], start: int, generation: int):
+        """Append one batch of rows, then schedule the next if any remain."""
+        if generation != self._load_generation:
+            return
+        
+        batch = positions[start:start + self.BATCH_SIZE]
+        self._append_rows(batch)
+        
+        if start + len(batch) < len(positions):
+            self._schedule_batch(positions, start + len(batch))
+        else:
+            self._pending_load = None
+    
+    def _append_rows(self, positions: List[Dict[str, Any]]):
+        """Append rows to the end of the model."""
+        first_row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(positions) - 1)
+        self._rows.extend(positions)
+        self._row_texts.extend([None] * len(positions))
+        self._symbol_keys.extend(self._symbol_key(position) for position in positions)
+        self.endInsertRows()
+    
+    def _complete_load(self):
+        """Append all rows of a batched load still in progress right away."""
+        if self._pending_load is None:
+            return
+        positions, start = self._pending_load
+        self._load_generation += 1
+        self._pending_load = None
+        self._append_rows(positions[start:])
+    
+    def replace_position(self, position: Dict[str, Any]) -> bool:
+        """
+        Replace the position with the same id, repainting only its row.
+        
+        Returns:
+            bool: False if no row holds a position with that id
+        """
+        self._complete_load()
+        for row, existing in enumerate(self._rows):
+            if existing['id'] == position['id']:
+                self._rows[row] = position
+                self._row_texts[row] = None
+                self._symbol_keys[row] = self._symbol_key(position)
+                self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1),
+                                      self._CHANGED_ROLES)
+                return True
+        return False
+    
+    def remove_positions(self, position_ids):
+        """Remove the rows of the given position ids, one removal per run of adjacent rows."""
+        self._complete_load()
+        position_ids = set(position_ids)
+        rows = [row for row, position in enumerate(self._rows) if position['id'] in position_ids]
+        
+        # Bottom-up, so the rows of runs still to remove keep their indices
+        for first, last in reversed(list(_row_runs(rows))):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            del self._row_texts[first:last + 1]
+            del self._symbol_keys[first:last + 1]
+            self.endRemoveRows()
+    
+    def update_positions(self, positions: List[Dict[str, Any]]):
+        """
+        Replace all positions, repainting only the cells that changed.
+        
+        When the new list holds the same positions in the same order (the
+        usual live-price refresh), each row is compared field by field and
+        dataChanged is emitted once per run of consecutive changed rows in
+        each affected column, so a tick that moves every price costs one
+        signal per price column. Any other change falls back to a model reset.
+        """
+        # Either path below replaces every row; stop any batched load in progress
+        self._load_generation += 1
+        self._pending_load = None
+        
+        old_rows = self._rows
+        if (len(positions) != len(old_rows)
+                or any(old['id'] != new['id'] for old, new in zip(old_rows, positions))):
+            self.set_positions(positions)
+            return
+        
+        self._rows = positions
+        columns_by_key = self._COLUMNS_BY_KEY
+        changed_rows_by_column: Dict[int, List[int]] = {}
+        for row, (old, new) in enumerate(zip(old_rows, positions)):
+            if old == new:
+                continue
+            
+            changed_columns = {
+                column
+                for key in old.keys() | new.keys()
+                if key in columns_by_key and old.get(key) != new.get(key)
+                for column in columns_by_key[key]
+            }
+            
+            # Re-format only the moved cells; entry figures keep their text
+            texts = self._row_texts[row]
+            if texts is not None:
+                texts = list(texts)
+                for column in changed_columns:
+                    texts[column] = self._display_text(new, column)
+                self._row_texts[row] = tuple(texts)
+            if self.SYMBOL_COLUMN in changed_columns:
+                self._symbol_keys[row] = self._symbol_key(new)
+            
+            for column in changed_columns:
+                changed_rows_by_column.setdefault(column, []).append(row)
+        
+        for column, rows in changed_rows_by_column.items():
+            for first, last in _row_runs(rows):
+                self._emit_cells_changed(column, first, last)
+    
+    def _emit_cells_changed(self, column: int, first_row: int, last_row: int):
+        """Signal that a run of cells in one column changed."""
+        self.dataChanged.emit(self.index(first_row, column), self.index(last_row, column),
+                              self._CHANGED_ROLES)
+    
+    def position(self, row: int) -> Dict[str, Any]:
+        """Return the position shown at the given source row."""
+        return self._rows[row]
+    
+    def symbol_key(self, row: int) -> str:
+        """Return the upper-cased symbol of the position at the given source row."""
+        return self._symbol_keys[row]
+    
+    @staticmethod
+    def _symbol_key(position: Dict[str, Any]) -> str:
+        """Return a position's symbol upper-cased for filtering."""
+        return position.get('symbol', '').upper()
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of positions."""
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Return the number of columns."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Return the horizontal header labels."""
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    @staticmethod
+    def _entry_value(position: Dict[str, Any]) -> float:
+        """Return the entry value, computing it when the backend did not."""
+        return position.get('entry_value', position['entry_price'] * position['quantity'])
+    
+    def _raw_value(self, position: Dict[str, Any], column: int):
+        """Return the unformatted value behind a cell."""
+        if column == self.ID_COLUMN:
+            return position['id']
+        if column == self.SYMBOL_COLUMN:
+            return position['symbol']
+        if column == self.ASSET_TYPE_COLUMN:
+            return position['asset_type']
+        if column == self.ENTRY_DATE_COLUMN:
+            return position['entry_date']
+        if column == self.ENTRY_PRICE_COLUMN:
+            return position['entry_price']
+        if column == self.QUANTITY_COLUMN:
+            return position['quantity']
+        if column == self.ENTRY_VALUE_COLUMN:
+            return self._entry_value(position)
+        if column == self.LAST_UPDATED_COLUMN:
+            return position.get('last_updated', 'Never')
+        return position.get(self._OPTIONAL_COLUMNS[column][0])
+    
+    def _display_text(self, position: Dict[str, Any], column: int) -> str:
+        """Return the formatted text for a cell."""
+        if column == self.ID_COLUMN:
+            return str(position['id'])
+        if column == self.SYMBOL_COLUMN:
+            return position['symbol']
+        if column == self.ASSET_TYPE_COLUMN:
+            return position['asset_type'].upper()
+        if column == self.ENTRY_DATE_COLUMN:
+            return position['entry_date']
+        if column == self.ENTRY_PRICE_COLUMN:
+            return f"${position['entry_price']:.4f}"
+        if column == self.QUANTITY_COLUMN:
+            return f"{position['quantity']:.4f}"
+        if column == self.ENTRY_VALUE_COLUMN:
+            return f"${self._entry_value(position):,.2f}"
+        if column == self.LAST_UPDATED_COLUMN:
+            return _format_last_updated(position.get('last_updated', 'Never'))
+        
+        key, template = self._OPTIONAL_COLUMNS[column]
+        value = position.get(key)
+        return "N/A" if value is None else template.format(value)
+    
+    def _background(self, position: Dict[str, Any], column: int) -> Optional[QBrush]:
+        """Return the background color for a cell, if it has one."""
+        if column == self.LIVE_PRICE_COLUMN:
+            if position.get('live_price') is None:
+                return _MISSING_BRUSH
+            return _sign_brush(position.get('price_change_percent') or 0)
+        if column == self.PNL_COLUMN or column == self.PNL_PERCENT_COLUMN:
+            value = position.get(self._OPTIONAL_COLUMNS[column][0])
+            if value is not None:
+                return _sign_brush(value)
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return the display text, alignment, background and sort value for a cell."""
+        if not index.isValid():
+            return None
+        
+        position = self._rows[index.row()]
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            texts = self._row_texts[index.row()]
+            if texts is None:
+                texts = tuple(self._display_text(position, c) for c in range(len(self.HEADERS)))
+                self._row_texts[index.row()] = texts
+            return texts[column]
+        
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            # Numeric cells are right-aligned; "N/A" placeholders are not
+            if self.ENTRY_PRICE_COLUMN <= column <= self.ENTRY_VALUE_COLUMN:
+                return _RIGHT_VCENTER
+            if column in self._OPTIONAL_COLUMNS and position.get(self._OPTIONAL_COLUMNS[column][0]) is not None:
+                return _RIGHT_VCENTER
+            return None
+        
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._background(position, column)
+        
+        if role == _SORT_ROLE:
+            return self._raw_value(position, column)
+        
+        return None
+
+
+class PositionsFilterProxy(QSortFilterProxyModel):
+    """
+    Sort/filter proxy for the positions table.
+    
+    Filters by symbol substring and asset type against the source model's
+    position dicts, so changing a filter only hides rows and never rebuilds
+    the model.
+    """
+    
+    def __init__(self, parent=None):
+        """Initialize the proxy with no filters applied."""
+        super().__init__(parent)
+        self._symbol_filter = ""
+        self._asset_type = "All"
+    
+    def set_symbol_filter(self, text: str):
+        """Show only positions whose symbol contains the given text."""
+        text = text.strip().upper()
+        if text != self._symbol_filter:
+            self._symbol_filter = text
+            self.invalidateFilter()
+    
+    def set_asset_type(self, asset_type: str):
+        """Show only positions of the given asset type ("All" for any)."""
+        if asset_type != self._asset_type:
+            self._asset_type = asset_type
+            self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        """Return whether a source row passes the symbol and asset type filters."""
+        model = self.sourceModel()
+        if self._symbol_filter and self._symbol_filter not in model.symbol_key(source_row):
+            return False
+        if self._asset_type != "All" and model.position(source_row).get('asset_type', '') != self._asset_type:
+            return False
+        return True
+
 
 class PositionsPage(QWidget):
     """
@@ -44,6 +534,64 @@ class PositionsPage(QWidget):
     # Signals for data updates
     data_updated = Signal()
     
+    # Tab indices
+    POSITIONS_TAB = 0
+    PORTFOLIO_TAB = 1
+    PERFORMANCE_TAB = 2
+    
+    # Initial widths (px) of the user-resizable columns; set once instead of
+    # measuring every row's contents on refresh
+    _COLUMN_WIDTHS = {
+        PositionsModel.SYMBOL_COLUMN: 70,
+        PositionsModel.ASSET_TYPE_COLUMN: 80,
+        PositionsModel.ENTRY_DATE_COLUMN: 90,
+        PositionsModel.ENTRY_PRICE_COLUMN: 90,
+        PositionsModel.QUANTITY_COLUMN: 90,
+        PositionsModel.ENTRY_VALUE_COLUMN: 100,
+        PositionsModel.LIVE_PRICE_COLUMN: 90,
+        PositionsModel.CURRENT_VALUE_COLUMN: 110,
+        PositionsModel.PNL_COLUMN: 110,
+        PositionsModel.PNL_PERCENT_COLUMN: 70,
+        PositionsModel.PRICE_CHANGE_COLUMN: 100,
+    }
+    
+    # Fixed head of the portfolio overview, filled from portfolio P&L and summary fields
+    _PORTFOLIO_HEADER = """PORTFOLIO OVERVIEW
+============================================
+
+PORTFOLIO VALUE:
+• Total Entry Value:    ${total_entry_value:,.2f}
+• Total Current Value:  ${total_current_value:,.2f}
+• Total Unrealized P&L: ${total_unrealized_pnl:,.2f}
+• Portfolio Return:     {portfolio_return_percent:+.2f}%
+
+PORTFOLIO BREAKDOWN:
+• Total Positions:      {total_positions}
+• Successful Fetches:   {successful_fetches}
+• Failed Fetches:       {failed_fetches}
+
+ASSET ALLOCATION:"""
+    _PORTFOLIO_PNL_FIELDS = (
+        'total_entry_value', 'total_current_value', 'total_unrealized_pnl', 'portfolio_return_percent'
+    )
+    _PORTFOLIO_SUMMARY_FIELDS = ('total_positions', 'successful_fetches', 'failed_fetches')
+    
+    # Fixed head of the performance metrics, filled from portfolio P&L fields
+    _PERFORMANCE_HEADER = """PERFORMANCE METRICS
+============================================
+
+OVERALL PERFORMANCE:
+• Total Unrealized P&L: ${total_unrealized_pnl:,.2f}
+• Portfolio Return:     {portfolio_return_percent:+.2f}%
+• Best Performer:       {best_performer}
+• Worst Performer:      {worst_performer}
+
+TOP PERFORMERS (by P&L %):"""
+    _PERFORMANCE_DEFAULTS = {
+        'total_unrealized_pnl': 0, 'portfolio_return_percent': 0,
+        'best_performer': 'N/A', 'worst_performer': 'N/A',
+    }
+    
     def __init__(self, open_positions: Optional[OpenPositions] = None):
         """
         Initialize the Open Positions page.
@@ -59,13 +607,59 @@ class PositionsPage(QWidget):
         # Data storage for tables
         self.positions_data = []
         
-        # Auto-refresh timer
+        # Auto-refresh timer; only runs while the Positions tab is on screen
         self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_live_data)
+        self.refresh_timer.timeout.connect(self._on_refresh_timer)
         self.auto_refresh_enabled = False
         
+        # Live price fetch and full snapshot load running in the background, if any
+        self._live_thread: Optional[TaskThread] = None
+        self._snapshot_thread: Optional[TaskThread] = None
+        
+        # Position update/delete being written in the background, if any
+        self._write_thread: Optional[TaskThread] = None
+        self._snapshot_again = False
+        
+        # Time since the last live price fetch finished (invalid until one has)
+        self._since_live_refresh = QElapsedTimer()
+        
+        # False while the application is hidden or suspended by the system
+        self._app_visible = True
+        QGuiApplication.instance().applicationStateChanged.connect(self._on_application_state_changed)
+        
+        # Last loaded snapshot, shown by tabs that are built after it arrived
+        self._latest_snapshot: Optional[PositionsSnapshot] = None
+        
+        # Report tabs whose text is older than the latest snapshot because
+        # they were not current when it arrived
+        self._stale_tabs = set()
+        
+        # Fingerprint of the positions last loaded by refresh_positions
+        self._positions_version: Optional[tuple] = None
+        
+        # Columns are fitted to their contents once, on the first non-empty load
+        self._columns_fitted = False
+        
+        # Inputs behind the text last shown in the portfolio/performance tabs
+        self._portfolio_key: Optional[tuple] = None
+        self._performance_key: Optional[tuple] = None
+        
+        # Add/edit dialogs, built on first use and reused afterwards
+        self._add_dialog: Optional[AddPositionDialog] = None
+        self._edit_dialog: Optional[EditPositionDialog] = None
+        
+        # Symbol filter debounce: a burst of keystrokes applies the filter once
+        self._filter_debounce = QTimer(self)
+        self._filter_debounce.setSingleShot(True)
+        self._filter_debounce.setInterval(150)
+        self._filter_debounce.timeout.connect(self._apply_filters_now)
+        
         self._setup_ui()
         
+        # Restore the auto-refresh choice from the last session
+        if QSettings().value(_AUTO_REFRESH_SETTING, False, type=bool):
+            self._set_auto_refresh(True)
+        
         # Load initial data if business logic is available
         if self.open_positions:
             self.refresh_data()
@@ -97,10 +691,66 @@ class PositionsPage(QWidget):
         self.tab_widget = QTabWidget()
         main_layout.addWidget(self.tab_widget)
         
-        # Add tabs
+        # Add tabs; portfolio and performance are built the first time they are shown
         self._setup_positions_tab()
-        self._setup_portfolio_tab()
-        self._setup_performance_tab()
+        self.tab_widget.addTab(QWidget(), _TAB_PORTFOLIO)
+        self.tab_widget.addTab(QWidget(), _TAB_PERFORMANCE)
+        
+        self._tab_builders = {
+            self.PORTFOLIO_TAB: (self._setup_portfolio_tab, self._show_latest_portfolio),
+            self.PERFORMANCE_TAB: (self._setup_performance_tab, self._show_latest_performance),
+        }
+        self._tab_built = {
+            self.POSITIONS_TAB: True,
+            self.PORTFOLIO_TAB: False,
+            self.PERFORMANCE_TAB: False,
+        }
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        self.tab_widget.currentChanged.connect(self._show_if_stale)
+        self.tab_widget.currentChanged.connect(self._update_refresh_timer)
+    
+    def _ensure_tab_built(self, index: int):
+        """Build a lazily created tab the first time it is shown."""
+        if self._tab_built.get(index, True):
+            return
+        
+        builder, shower = self._tab_builders[index]
+        placeholder = self.tab_widget.widget(index)
+        
+        # Swap the placeholder for the real tab without re-entering this slot
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            builder(index)
+            self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+        
+        placeholder.deleteLater()
+        self._tab_built[index] = True
+        shower()
+    
+    def _show_if_stale(self, index: int):
+        """Bring a report tab up to date with the latest snapshot when it is shown."""
+        if index in self._stale_tabs:
+            _, shower = self._tab_builders[index]
+            shower()
+    
+    def _show_latest_portfolio(self):
+        """Show the portfolio from the last snapshot, loading one if there is none."""
+        if self._latest_snapshot is None:
+            self.refresh_portfolio()
+        else:
+            self._apply_portfolio(self._latest_snapshot.portfolio_pnl,
+                                  self._latest_snapshot.positions_summary)
+    
+    def _show_latest_performance(self):
+        """Show the performance from the last snapshot, loading one if there is none."""
+        if self._latest_snapshot is None:
+            self.refresh_performance()
+        else:
+            self._apply_performance(self._latest_snapshot.top_performers,
+                                    self._latest_snapshot.portfolio_pnl)
     
     def _setup_positions_tab(self):
         """Set up the positions overview tab."""
@@ -142,7 +792,7 @@ class PositionsPage(QWidget):
         
         # Control buttons
         self.refresh_prices_btn = QPushButton("Refresh Prices")
-        self.refresh_prices_btn.clicked.connect(self.refresh_live_data)
+        self.refresh_prices_btn.clicked.connect(self._refresh_prices_now)
         header_layout.addWidget(self.refresh_prices_btn)
         
         self.auto_refresh_btn = QPushButton("Auto-Refresh OFF")
@@ -162,15 +812,16 @@ class PositionsPage(QWidget):
         filter_layout.addWidget(QLabel("Symbol:"))
         self.symbol_filter = QLineEdit()
         self.symbol_filter.setPlaceholderText("Filter by symbol...")
-        self.symbol_filter.textChanged.connect(self._apply_filters)
+        # Only user edits start the filter; programmatic clears apply it directly
+        self.symbol_filter.textEdited.connect(self._filter_debounce.start)
         filter_layout.addWidget(self.symbol_filter)
         
         # Asset type filter
         filter_layout.addWidget(QLabel("Asset Type:"))
         self.asset_type_filter = QComboBox()
         self.asset_type_filter.addItem("All")
-        self.asset_type_filter.addItems(["stock", "crypto", "etf", "forex", "commodity", "bond", "option", "future"])
-        self.asset_type_filter.currentTextChanged.connect(self._apply_filters)
+        self.asset_type_filter.addItems(ASSET_TYPES)
+        self.asset_type_filter.currentTextChanged.connect(self._apply_filters_now)
         filter_layout.addWidget(self.asset_type_filter)
         
         # Clear filters button
@@ -187,48 +838,52 @@ class PositionsPage(QWidget):
         self.status_label.setStyleSheet("color: #666666; font-style: italic;")
         layout.addWidget(self.status_label)
         
-        # Positions table
-        self.positions_table = QTableWidget()
+        # Positions table: the model holds the data, the proxy filters it and
+        # sorts it on raw values
+        self.positions_model = PositionsModel(self)
+        self.positions_proxy = PositionsFilterProxy(self)
+        self.positions_proxy.setSourceModel(self.positions_model)
+        self.positions_proxy.setSortRole(_SORT_ROLE)
+        
+        self.positions_table = QTableView()
+        self.positions_table.setModel(self.positions_proxy)
         self.positions_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.positions_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.positions_table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.positions_table.setAlternatingRowColors(True)
         self.positions_table.setSortingEnabled(True)
         
-        # Connect selection changed signal
+        # Connect selection changed signal. A model reset clears the selection
+        # without emitting it, so resync the edit/delete buttons then too.
         self.positions_table.selectionModel().selectionChanged.connect(self._on_position_selection_changed)
+        self.positions_proxy.modelReset.connect(self._on_position_selection_changed)
         
-        # Table headers
-        headers = [
-            "ID", "Symbol", "Asset Type", "Entry Date", "Entry Price", "Quantity", 
-            "Entry Value", "Live Price", "Current Value", "P&L", "P&L %", "Price Change %", "Last Updated"
-        ]
-        self.positions_table.setColumnCount(len(headers))
-        self.positions_table.setHorizontalHeaderLabels(headers)
+        # Fixed-height rows: row geometry is computed, never measured per row
+        self.positions_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.positions_table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         
         # Hide ID column
         self.positions_table.setColumnHidden(0, True)
         
         # Resize columns
         header = self.positions_table.horizontalHeader()
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)  # Symbol
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Asset Type
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)  # Entry Date
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)  # Entry Price
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)  # Quantity
-        header.setSectionResizeMode(6, QHeaderView.ResizeMode.ResizeToContents)  # Entry Value
-        header.setSectionResizeMode(7, QHeaderView.ResizeMode.ResizeToContents)  # Live Price
-        header.setSectionResizeMode(8, QHeaderView.ResizeMode.ResizeToContents)  # Current Value
-        header.setSectionResizeMode(9, QHeaderView.ResizeMode.ResizeToContents)  # P&L
-        header.setSectionResizeMode(10, QHeaderView.ResizeMode.ResizeToContents) # P&L %
-        header.setSectionResizeMode(11, QHeaderView.ResizeMode.ResizeToContents) # Price Change %
-        header.setSectionResizeMode(12, QHeaderView.ResizeMode.Stretch)          # Last Updated
+        # Fixed starting widths: refreshes never measure cell contents
+        for column, width in self._COLUMN_WIDTHS.items():
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
+            header.resizeSection(column, width)
+        header.setSectionResizeMode(PositionsModel.LAST_UPDATED_COLUMN, QHeaderView.ResizeMode.Stretch)
+        
+        # Measuring contents is available on demand from the header's context menu
+        auto_fit_action = QAction("Auto-fit Columns", header)
+        auto_fit_action.triggered.connect(self._auto_fit_columns)
+        header.addAction(auto_fit_action)
+        header.setContextMenuPolicy(Qt.ContextMenuPolicy.ActionsContextMenu)
         
         layout.addWidget(self.positions_table)
         
         # Add to tab widget
-        self.tab_widget.addTab(positions_widget, "🎯 Positions")
+        self.tab_widget.addTab(positions_widget, _TAB_POSITIONS)
     
-    def _setup_portfolio_tab(self):
+    def _setup_portfolio_tab(self, index: int):
         """Set up the portfolio overview tab."""
         portfolio_widget = QWidget()
         layout = QVBoxLayout(portfolio_widget)
@@ -242,20 +897,8 @@ class PositionsPage(QWidget):
         layout.addWidget(header_label)
         
         # Portfolio content
-        self.portfolio_content = QLabel("Loading portfolio overview...")
-        self.portfolio_content.setStyleSheet("""
-            QLabel {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 8px;
-                padding: 20px;
-                margin: 10px;
-                font-family: monospace;
-                font-size: 12px;
-            }
-        """)
-        self.portfolio_content.setWordWrap(True)
-        self.portfolio_content.setAlignment(Qt.AlignmentFlag.AlignTop)
+        # Read-only document so refreshes rewrite only the lines that changed
+        self.portfolio_content = ReportView("Loading portfolio overview...")
         layout.addWidget(self.portfolio_content)
         
         # Refresh button
@@ -264,9 +907,9 @@ class PositionsPage(QWidget):
         layout.addWidget(refresh_portfolio_btn)
         
         # Add to tab widget
-        self.tab_widget.addTab(portfolio_widget, "📊 Portfolio")
+        self.tab_widget.insertTab(index, portfolio_widget, _TAB_PORTFOLIO)
     
-    def _setup_performance_tab(self):
+    def _setup_performance_tab(self, index: int):
         """Set up the performance tracking tab."""
         performance_widget = QWidget()
         layout = QVBoxLayout(performance_widget)
@@ -280,20 +923,8 @@ class PositionsPage(QWidget):
         layout.addWidget(header_label)
         
         # Performance content
-        self.performance_content = QLabel("Loading performance metrics...")
-        self.performance_content.setStyleSheet("""
-            QLabel {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 8px;
-                padding: 20px;
-                margin: 10px;
-                font-family: monospace;
-                font-size: 12px;
-            }
-        """)
-        self.performance_content.setWordWrap(True)
-        self.performance_content.setAlignment(Qt.AlignmentFlag.AlignTop)
+        # Read-only document so refreshes rewrite only the lines that changed
+        self.performance_content = ReportView("Loading performance metrics...")
         layout.addWidget(self.performance_content)
         
         # Refresh button
@@ -302,175 +933,319 @@ class PositionsPage(QWidget):
         layout.addWidget(refresh_performance_btn)
         
         # Add to tab widget
-        self.tab_widget.addTab(performance_widget, "📈 Performance")
+        self.tab_widget.insertTab(index, performance_widget, _TAB_PERFORMANCE)
     
     def _toggle_auto_refresh(self):
-        """Toggle auto-refresh for live prices."""
-        if self.auto_refresh_enabled:
-            self.refresh_timer.stop()
-            self.auto_refresh_enabled = False
+        """Toggle auto-refresh for live prices and remember the choice."""
+        self._set_auto_refresh(not self.auto_refresh_enabled)
+        QSettings().setValue(_AUTO_REFRESH_SETTING, self.auto_refresh_enabled)
+    
+    def _set_auto_refresh(self, enabled: bool):
+        """Turn auto-refresh for live prices on or off."""
+        self.auto_refresh_enabled = enabled
+        if enabled:
+            self.auto_refresh_btn.setText("Auto-Refresh ON")
+            self.status_label.setText("Auto-refresh enabled (interval follows market hours)")
+            logger.info("Auto-refresh enabled")
+        else:
             self.auto_refresh_btn.setText("Auto-Refresh OFF")
             self.status_label.setText("Auto-refresh disabled")
             logger.info("Auto-refresh disabled")
-        else:
-            self.refresh_timer.start(30000)  # Refresh every 30 seconds
-            self.auto_refresh_enabled = True
-            self.auto_refresh_btn.setText("Auto-Refresh ON")
-            self.status_label.setText("Auto-refresh enabled (30s interval)")
-            logger.info("Auto-refresh enabled")
+        self._update_refresh_timer()
     
-    def _apply_filters(self):
-        """Apply filters to the positions table."""
-        if not self.positions_data:
-            return
-        
-        symbol_filter = self.symbol_filter.text().strip().upper()
-        asset_type_filter = self.asset_type_filter.currentText()
-        
-        # Filter the data
-        filtered_data = []
-        for position in self.positions_data:
-            # Symbol filter
-            if symbol_filter and symbol_filter not in position.get('symbol', '').upper():
-                continue
-            
-            # Asset type filter
-            if asset_type_filter != "All" and position.get('asset_type', '') != asset_type_filter:
-                continue
-            
-            filtered_data.append(position)
+    def _update_refresh_timer(self):
+        """
+        Run the auto-refresh timer only while its results can be seen.
         
-        # Update the table with filtered data
-        self._populate_positions_table(filtered_data)
-        logger.info(f"Applied filters: {len(filtered_data)}/{len(self.positions_data)} positions shown")
+        The timer is paused while the page or the application is hidden or
+        another tab is current. When it resumes, prices that went stale in
+        the meantime are fetched right away rather than on the next tick.
+        """
+        should_run = (
+            self.auto_refresh_enabled
+            and self._app_visible
+            and self.isVisible()
+            and self.tab_widget.currentIndex() == self.POSITIONS_TAB
+        )
+        if should_run and not self.refresh_timer.isActive():
+            self.refresh_timer.start(self._compute_refresh_interval_ms())
+            self._catch_up_live_data()
+        elif not should_run and self.refresh_timer.isActive():
+            self.refresh_timer.stop()
+    
+    def _catch_up_live_data(self):
+        """Fetch live prices now if the last fetch is older than the refresh interval."""
+        if (not self._since_live_refresh.isValid()
+                or self._since_live_refresh.hasExpired(self.refresh_timer.interval())):
+            self.refresh_live_data()
+    
+    def _on_application_state_changed(self, state):
+        """Pause auto-refresh while the application is hidden or suspended."""
+        self._app_visible = state not in (
+            Qt.ApplicationState.ApplicationHidden, Qt.ApplicationState.ApplicationSuspended
+        )
+        self._update_refresh_timer()
+    
+    def _compute_refresh_interval_ms(self) -> int:
+        """Return the auto-refresh interval for the current market hours."""
+        has_crypto = any(position.get('asset_type') == 'crypto' for position in self.positions_data)
+        return _refresh_interval_ms(has_crypto)
+    
+    def _on_refresh_timer(self):
+        """Refresh live prices on an auto-refresh tick unless the window is minimized."""
+        # Reschedule each tick so the interval follows the market open/close
+        self.refresh_timer.setInterval(self._compute_refresh_interval_ms())
+        if self.window().isMinimized():
+            return
+        self.refresh_live_data()
+    
+    def showEvent(self, event):
+        """Resume auto-refresh when the page becomes visible."""
+        super().showEvent(event)
+        self._update_refresh_timer()
+        
+        # Restoring a minimized window shows the page with the timer still
+        # running; catch up on the ticks that were skipped meanwhile
+        if event.spontaneous() and self.refresh_timer.isActive():
+            self._catch_up_live_data()
+    
+    def hideEvent(self, event):
+        """Pause auto-refresh while the page is hidden."""
+        super().hideEvent(event)
+        self._update_refresh_timer()
+    
+    def _apply_filters_now(self):
+        """Apply the filter controls to the positions table."""
+        self._filter_debounce.stop()
+        self.positions_proxy.set_symbol_filter(self.symbol_filter.text())
+        self.positions_proxy.set_asset_type(self.asset_type_filter.currentText())
+        logger.info(
+            f"Applied filters: {self.positions_proxy.rowCount()}/{len(self.positions_data)} positions shown"
+        )
     
     def _clear_filters(self):
         """Clear all filters and show all positions."""
+        # Reset both controls silently, then filter once
         self.symbol_filter.clear()
-        self.asset_type_filter.setCurrentIndex(0)  # "All"
-        self._populate_positions_table(self.positions_data)
+        with QSignalBlocker(self.asset_type_filter):
+            self.asset_type_filter.setCurrentIndex(0)  # "All"
+        self._apply_filters_now()
     
-    def refresh_positions(self):
-        """Refresh the positions table with current data."""
+    def refresh_positions(self, force: bool = False):
+        """
+        Refresh the positions table with current data.
+        
+        The reload is skipped when the stored positions' fingerprint is
+        unchanged since the last one, unless forced (after an edit).
+        """
         if not self.open_positions:
             return
         
         try:
+            version = self.open_positions.positions_version()
+            if not force and version == self._positions_version:
+                logger.debug("Positions unchanged since last load; skipping reload")
+                return
+            
             self.positions_data = self.open_positions.get_all_positions()
-            self._apply_filters()  # This will populate the table with current filters
+            self._positions_version = version
+            self._populate_positions_table(self.positions_data)  # Current filters stay applied
             self.status_label.setText(f"Loaded {len(self.positions_data)} positions")
             logger.info(f"Refreshed positions table with {len(self.positions_data)} records")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to refresh positions: {str(e)}")
             logger.error(f"Failed to refresh positions: {e}")
     
+    def _refresh_prices_now(self):
+        """Refresh live prices on request, bypassing the recent-quote cache."""
+        if self.open_positions:
+            self.open_positions.invalidate_quote_cache()
+        self.refresh_live_data()
+    
     def refresh_live_data(self):
-        """Refresh positions with live prices and P&L calculations."""
+        """
+        Refresh positions with live prices and P&L calculations.
+        
+        Prices are fetched on a background thread; the table is updated when
+        they arrive. A request made while a fetch is in flight is dropped.
+        """
         if not self.open_positions:
             self.status_label.setText("Open Positions service not available")
             return
         
-        try:
-            self.status_label.setText("Fetching live prices...")
-            
-            # Get positions with live prices
-            self.positions_data = self.open_positions.get_all_positions_with_live_prices()
-            self._apply_filters()  # This will populate the table with current filters
-            
-            # Count successful price fetches
-            successful_fetches = sum(1 for pos in self.positions_data if pos.get('live_price') is not None)
-            total_positions = len(self.positions_data)
-            
-            self.status_label.setText(
-                f"Updated {successful_fetches}/{total_positions} positions with live prices"
-            )
-            logger.info(f"Refreshed {successful_fetches}/{total_positions} positions with live data")
-            
-        except Exception as e:
-            error_msg = f"Failed to refresh live data: {str(e)}"
-            self.status_label.setText(error_msg)
-            QMessageBox.critical(self, "Error", error_msg)
-            logger.error(f"Failed to refresh live data: {e}")
+        if self._live_thread is not None:
+            logger.debug("Skipping live price refresh: a fetch is already in flight")
+            return
+        
+        self.status_label.setText("Fetching live prices...")
+        self.refresh_prices_btn.setEnabled(False)
+        
+        thread = TaskThread('live_prices', self.open_positions.get_all_positions_with_live_prices, parent=self)
+        thread.result_ready.connect(self._on_live_data)
+        thread.error_occurred.connect(self._on_live_data_error)
+        self._live_thread = thread
+        thread.start()
+    
+    def _on_live_data(self, name: str, positions: List[Dict[str, Any]]):
+        """Apply positions with live prices delivered by the background fetch."""
+        self._finish_live_refresh()
+        self._apply_positions(positions)
+    
+    def _apply_positions(self, positions: List[Dict[str, Any]]):
+        """Show positions enhanced with live prices in the table."""
+        # Same positions with new prices: only the changed cells are repainted,
+        # in one paint pass after all their dataChanged runs are emitted
+        self.positions_data = positions
+        with frozen(self.positions_table):
+            self.positions_model.update_positions(self.positions_data)
+        
+        # Count successful price fetches
+        successful_fetches = sum(1 for pos in self.positions_data if pos.get('live_price') is not None)
+        total_positions = len(self.positions_data)
+        
+        self.status_label.setText(
+            f"Updated {successful_fetches}/{total_positions} positions with live prices"
+        )
+        logger.info(f"Refreshed {successful_fetches}/{total_positions} positions with live data")
+    
+    def _on_live_data_error(self, name: str, error_msg: str):
+        """Report a failed background price fetch."""
+        self._finish_live_refresh()
+        
+        error_msg = f"Failed to refresh live data: {error_msg}"
+        self.status_label.setText(error_msg)
+        QMessageBox.critical(self, "Error", error_msg)
+        logger.error(error_msg)
+    
+    def _finish_live_refresh(self):
+        """Release the completed price fetch and re-enable manual refresh."""
+        self._live_thread = None
+        self._since_live_refresh.start()
+        self.refresh_prices_btn.setEnabled(True)
     
     def refresh_portfolio(self):
-        """Refresh the portfolio overview."""
+        """Refresh the portfolio overview (with the other views, from one snapshot)."""
+        if not self._tab_built[self.PORTFOLIO_TAB]:
+            return
+        
         if not self.open_positions:
-            self.portfolio_content.setText("Open Positions service not available")
+            self.portfolio_content.set_report_text("Open Positions service not available")
+            self._portfolio_key = None
+            return
+        
+        self._request_snapshot()
+    
+    def _apply_portfolio(self, portfolio_pnl: Dict[str, Any], positions_summary: Dict[str, Any]):
+        """Show the portfolio overview for already fetched analytics."""
+        if not self._tab_built[self.PORTFOLIO_TAB]:
+            return
+        
+        # Nobody sees the report: rebuild it when the tab is next shown
+        if self.tab_widget.currentIndex() != self.PORTFOLIO_TAB:
+            self._stale_tabs.add(self.PORTFOLIO_TAB)
             return
+        self._stale_tabs.discard(self.PORTFOLIO_TAB)
         
         try:
-            # Get portfolio P&L
-            portfolio_pnl = self.open_positions.calculate_portfolio_pnl()
-            
-            # Get positions summary
-            positions_summary = self.open_positions.get_positions_summary()
+            # Skip formatting and re-laying out the label if nothing shown changed
+            inputs = self._portfolio_inputs(portfolio_pnl, positions_summary)
+            if inputs == self._portfolio_key:
+                return
             
-            # Format portfolio text
-            portfolio_text = f"""PORTFOLIO OVERVIEW
-============================================
-
-PORTFOLIO VALUE:
-• Total Entry Value:    ${portfolio_pnl.get('total_entry_value', 0):,.2f}
-• Total Current Value:  ${portfolio_pnl.get('total_current_value', 0):,.2f}
-• Total Unrealized P&L: ${portfolio_pnl.get('total_unrealized_pnl', 0):,.2f}
-• Portfolio Return:     {portfolio_pnl.get('portfolio_return_percent', 0):+.2f}%
-
-PORTFOLIO BREAKDOWN:
-• Total Positions:      {positions_summary.get('total_positions', 0)}
-• Successful Fetches:   {positions_summary.get('successful_fetches', 0)}
-• Failed Fetches:       {positions_summary.get('failed_fetches', 0)}
-
-ASSET ALLOCATION:
-"""
+            # Report lines are collected and joined once
+            fields = {field: portfolio_pnl.get(field, 0) for field in self._PORTFOLIO_PNL_FIELDS}
+            fields.update((field, positions_summary.get(field, 0)) for field in self._PORTFOLIO_SUMMARY_FIELDS)
+            lines = [self._PORTFOLIO_HEADER.format_map(fields)]
             
             # Asset type allocation
             asset_allocation = positions_summary.get('asset_allocation', {})
-            for asset_type, data in asset_allocation.items():
-                value = data.get('total_value', 0)
-                percentage = data.get('percentage', 0)
-                portfolio_text += f"• {asset_type.upper():<12}: ${value:>12,.2f} ({percentage:>5.1f}%)\n"
+            lines.extend(
+                f"• {asset_type.upper():<12}: ${data.get('total_value', 0):>12,.2f} "
+                f"({data.get('percentage', 0):>5.1f}%)"
+                for asset_type, data in asset_allocation.items()
+            )
             
-            portfolio_text += "\nTOP POSITIONS BY VALUE:\n"
+            lines.append("\nTOP POSITIONS BY VALUE:")
             top_positions = positions_summary.get('top_positions', [])
-            for pos in top_positions[:5]:
-                symbol = pos.get('symbol', 'N/A')
-                current_value = pos.get('current_value', 0)
-                pnl_percent = pos.get('unrealized_pnl_percent', 0)
-                portfolio_text += f"• {symbol:<12}: ${current_value:>12,.2f} ({pnl_percent:+5.1f}%)\n"
+            lines.extend(
+                f"• {pos.get('symbol', 'N/A'):<12}: ${pos.get('current_value', 0):>12,.2f} "
+                f"({pos.get('unrealized_pnl_percent', 0):+5.1f}%)"
+                for pos in top_positions[:5]
+            )
+            portfolio_text = "\n".join(lines) + "\n"
             
-            self.portfolio_content.setText(portfolio_text)
+            self.portfolio_content.set_report_text(portfolio_text)
+            self._portfolio_key = inputs
             logger.info("Refreshed portfolio overview")
             
         except Exception as e:
             error_text = f"Error loading portfolio overview: {str(e)}"
-            self.portfolio_content.setText(error_text)
+            self.portfolio_content.set_report_text(error_text)
+            self._portfolio_key = None
             logger.error(f"Failed to refresh portfolio: {e}")
     
+    @staticmethod
+    def _portfolio_inputs(portfolio_pnl: Dict[str, Any], positions_summary: Dict[str, Any]) -> tuple:
+        """Return the values the portfolio overview text is built from."""
+        return (
+            tuple(portfolio_pnl.get(field, 0) for field in PositionsPage._PORTFOLIO_PNL_FIELDS),
+            tuple(positions_summary.get(field, 0) for field in PositionsPage._PORTFOLIO_SUMMARY_FIELDS),
+            tuple((asset_type, data.get('total_value', 0), data.get('percentage', 0))
+                  for asset_type, data in positions_summary.get('asset_allocation', {}).items()),
+            tuple((pos.get('symbol', 'N/A'), pos.get('current_value', 0), pos.get('unrealized_pnl_percent', 0))
+                  for pos in positions_summary.get('top_positions', [])[:5]),
+        )
+    
+    @staticmethod
+    def _performance_inputs(top_performers: List[Dict[str, Any]], portfolio_pnl: Dict[str, Any]) -> tuple:
+        """Return the values the performance metrics text is built from."""
+        return (
+            portfolio_pnl.get('total_unrealized_pnl', 0),
+            portfolio_pnl.get('portfolio_return_percent', 0),
+            portfolio_pnl.get('best_performer', 'N/A'),
+            portfolio_pnl.get('worst_performer', 'N/A'),
+            tuple((pos.get('symbol', 'N/A'), pos.get('unrealized_pnl', 0),
+                   pos.get('unrealized_pnl_percent', 0), pos.get('live_price', 0))
+                  for pos in top_performers),
+        )
+    
     def refresh_performance(self):
-        """Refresh the performance metrics."""
+        """Refresh the performance metrics (with the other views, from one snapshot)."""
+        if not self._tab_built[self.PERFORMANCE_TAB]:
+            return
+        
         if not self.open_positions:
-            self.performance_content.setText("Open Positions service not available")
+            self.performance_content.set_report_text("Open Positions service not available")
+            self._performance_key = None
             return
         
+        self._request_snapshot()
+    
+    def _apply_performance(self, top_performers: List[Dict[str, Any]], portfolio_pnl: Dict[str, Any]):
+        """Show the performance metrics for already fetched analytics."""
+        if not self._tab_built[self.PERFORMANCE_TAB]:
+            return
+        
+        # Nobody sees the report: rebuild it when the tab is next shown
+        if self.tab_widget.currentIndex() != self.PERFORMANCE_TAB:
+            self._stale_tabs.add(self.PERFORMANCE_TAB)
+            return
+        self._stale_tabs.discard(self.PERFORMANCE_TAB)
+        
         try:
-            # Get top performers
-            top_performers = self.open_positions.get_top_performers(limit=10)
+            # Skip formatting and re-laying out the label if nothing shown changed
+            inputs = self._performance_inputs(top_performers, portfolio_pnl)
+            if inputs == self._performance_key:
+                return
             
-            # Get portfolio P&L
-            portfolio_pnl = self.open_positions.calculate_portfolio_pnl()
+            # Report lines are collected and joined once
+            fields = {field: portfolio_pnl.get(field, default) for field, default in self._PERFORMANCE_DEFAULTS.items()}
+            lines = [self._PERFORMANCE_HEADER.format_map(fields)]
             
-            # Format performance text
-            performance_text = f"""PERFORMANCE METRICS
-============================================
-
-OVERALL PERFORMANCE:
-• Total Unrealized P&L: ${portfolio_pnl.get('total_unrealized_pnl', 0):,.2f}
-• Portfolio Return:     {portfolio_pnl.get('portfolio_return_percent', 0):+.2f}%
-• Best Performer:       {portfolio_pnl.get('best_performer', 'N/A')}
-• Worst Performer:      {portfolio_pnl.get('worst_performer', 'N/A')}
-
-TOP PERFORMERS (by P&L %):
-"""
+            # Risk statistics are counted in the same pass that formats the list
+            priced_count = 0
+            profitable_count = 0
+            losing_count = 0
             
             for i, pos in enumerate(top_performers, 1):
                 symbol = pos.get('symbol', 'N/A')
@@ -479,161 +1254,134 @@ TOP PERFORMERS (by P&L %):
                 live_price = pos.get('live_price', 0)
                 
                 status = "📈" if pnl >= 0 else "📉"
-                performance_text += f"{i:2d}. {status} {symbol:<8}: ${pnl:>8,.2f} ({pnl_percent:+6.1f}%)"
-                
                 if live_price:
-                    performance_text += f" @ ${live_price:.2f}\n"
+                    priced_count += 1
+                    price_text = f" @ ${live_price:.2f}"
                 else:
-                    performance_text += " [Price N/A]\n"
+                    price_text = " [Price N/A]"
+                lines.append(f"{i:2d}. {status} {symbol:<8}: ${pnl:>8,.2f} ({pnl_percent:+6.1f}%){price_text}")
+                
+                if pnl > 0:
+                    profitable_count += 1
+                elif pnl < 0:
+                    losing_count += 1
             
             if not top_performers:
-                performance_text += "• No performance data available\n"
-            
-            performance_text += f"\nRISK METRICS:\n"
-            performance_text += f"• Positions with P&L data: {len([p for p in top_performers if p.get('live_price')])}\n"
-            performance_text += f"• Positions missing prices: {len([p for p in top_performers if not p.get('live_price')])}\n"
-            
-            # Calculate basic statistics
-            profitable_positions = [p for p in top_performers if p.get('unrealized_pnl', 0) > 0]
-            losing_positions = [p for p in top_performers if p.get('unrealized_pnl', 0) < 0]
+                lines.append("• No performance data available")
             
-            performance_text += f"• Profitable positions: {len(profitable_positions)}\n"
-            performance_text += f"• Losing positions: {len(losing_positions)}\n"
+            lines += [
+                "\nRISK METRICS:",
+                f"• Positions with P&L data: {priced_count}",
+                f"• Positions missing prices: {len(top_performers) - priced_count}",
+                f"• Profitable positions: {profitable_count}",
+                f"• Losing positions: {losing_count}",
+            ]
             
             if top_performers:
-                win_rate = (len(profitable_positions) / len(top_performers)) * 100
-                performance_text += f"• Win rate: {win_rate:.1f}%\n"
+                win_rate = (profitable_count / len(top_performers)) * 100
+                lines.append(f"• Win rate: {win_rate:.1f}%")
             
-            self.performance_content.setText(performance_text)
+            performance_text = "\n".join(lines) + "\n"
+            
+            self.performance_content.set_report_text(performance_text)
+            self._performance_key = inputs
             logger.info("Refreshed performance metrics")
             
         except Exception as e:
             error_text = f"Error loading performance metrics: {str(e)}"
-            self.performance_content.setText(error_text)
+            self.performance_content.set_report_text(error_text)
+            self._performance_key = None
             logger.error(f"Failed to refresh performance: {e}")
     
     def _populate_positions_table(self, positions_data: List[Dict[str, Any]]):
         """Populate the positions table with given data."""
-        self.positions_table.setRowCount(len(positions_data))
-        
-        for row, position in enumerate(positions_data):
-            # ID (hidden)
-            self.positions_table.setItem(row, 0, QTableWidgetItem(str(position['id'])))
-            
-            # Symbol
-            self.positions_table.setItem(row, 1, QTableWidgetItem(position['symbol']))
-            
-            # Asset Type
-            self.positions_table.setItem(row, 2, QTableWidgetItem(position['asset_type'].upper()))
-            
-            # Entry Date
-            self.positions_table.setItem(row, 3, QTableWidgetItem(position['entry_date']))
-            
-            # Entry Price
-            entry_price_item = QTableWidgetItem(f"${position['entry_price']:.4f}")
-            entry_price_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.positions_table.setItem(row, 4, entry_price_item)
-            
-            # Quantity
-            qty_item = QTableWidgetItem(f"{position['quantity']:.4f}")
-            qty_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.positions_table.setItem(row, 5, qty_item)
-            
-            # Entry Value
-            entry_value = position.get('entry_value', position['entry_price'] * position['quantity'])
-            entry_value_item = QTableWidgetItem(f"${entry_value:,.2f}")
-            entry_value_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.positions_table.setItem(row, 6, entry_value_item)
-            
-            # Live Price
-            live_price = position.get('live_price')
-            if live_price is not None:
-                live_price_item = QTableWidgetItem(f"${live_price:.4f}")
-                live_price_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                
-                # Color code based on price change
-                price_change_percent = position.get('price_change_percent', 0)
-                if price_change_percent > 0:
-                    live_price_item.setBackground(QColor(220, 255, 220))  # Light green
-                elif price_change_percent < 0:
-                    live_price_item.setBackground(QColor(255, 220, 220))  # Light red
-                
-                self.positions_table.setItem(row, 7, live_price_item)
-            else:
-                error_item = QTableWidgetItem("N/A")
-                error_item.setBackground(QColor(240, 240, 240))  # Light gray
-                self.positions_table.setItem(row, 7, error_item)
-            
-            # Current Value
-            current_value = position.get('current_value')
-            if current_value is not None:
-                current_value_item = QTableWidgetItem(f"${current_value:,.2f}")
-                current_value_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                self.positions_table.setItem(row, 8, current_value_item)
-            else:
-                self.positions_table.setItem(row, 8, QTableWidgetItem("N/A"))
-            
-            # P&L
-            unrealized_pnl = position.get('unrealized_pnl')
-            if unrealized_pnl is not None:
-                pnl_item = QTableWidgetItem(f"${unrealized_pnl:+,.2f}")
-                pnl_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                
-                # Color code P&L
-                if unrealized_pnl > 0:
-                    pnl_item.setBackground(QColor(220, 255, 220))  # Light green
-                elif unrealized_pnl < 0:
-                    pnl_item.setBackground(QColor(255, 220, 220))  # Light red
-                
-                self.positions_table.setItem(row, 9, pnl_item)
-            else:
-                self.positions_table.setItem(row, 9, QTableWidgetItem("N/A"))
-            
-            # P&L %
-            unrealized_pnl_percent = position.get('unrealized_pnl_percent')
-            if unrealized_pnl_percent is not None:
-                pnl_percent_item = QTableWidgetItem(f"{unrealized_pnl_percent:+.2f}%")
-                pnl_percent_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                
-                # Color code P&L %
-                if unrealized_pnl_percent > 0:
-                    pnl_percent_item.setBackground(QColor(220, 255, 220))  # Light green
-                elif unrealized_pnl_percent < 0:
-                    pnl_percent_item.setBackground(QColor(255, 220, 220))  # Light red
-                
-                self.positions_table.setItem(row, 10, pnl_percent_item)
-            else:
-                self.positions_table.setItem(row, 10, QTableWidgetItem("N/A"))
-            
-            # Price Change %
-            price_change_percent = position.get('price_change_percent')
-            if price_change_percent is not None:
-                price_change_item = QTableWidgetItem(f"{price_change_percent:+.2f}%")
-                price_change_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                self.positions_table.setItem(row, 11, price_change_item)
-            else:
-                self.positions_table.setItem(row, 11, QTableWidgetItem("N/A"))
-            
-            # Last Updated
-            last_updated = position.get('last_updated', 'Never')
-            if last_updated != 'Never' and 'T' in last_updated:
-                # Format timestamp
-                try:
-                    dt = datetime.fromisoformat(last_updated.replace('Z', '+00:00'))
-                    formatted_time = dt.strftime('%H:%M:%S')
-                    self.positions_table.setItem(row, 12, QTableWidgetItem(formatted_time))
-                except:
-                    self.positions_table.setItem(row, 12, QTableWidgetItem(last_updated))
-            else:
-                self.positions_table.setItem(row, 12, QTableWidgetItem(last_updated))
+        # One model reset (the proxy re-sorts once) and a single repaint
+        with frozen(self.positions_table):
+            self.positions_model.set_positions(positions_data)
+            if positions_data and not self._columns_fitted:
+                self._columns_fitted = True
+                self._fit_columns()
+    
+    def _auto_fit_columns(self):
+        """Size the resizable columns to their current contents, once."""
+        with frozen(self.positions_table):
+            self._fit_columns()
+    
+    def _fit_columns(self):
+        """Size each resizable column to the rows loaded so far."""
+        for column in self._COLUMN_WIDTHS:
+            self.positions_table.resizeColumnToContents(column)
+    
+    def _selected_position(self) -> Optional[Dict[str, Any]]:
+        """Return the position of the first selected table row, if any."""
+        selected_positions = self._selected_positions()
+        return selected_positions[0] if selected_positions else None
+    
+    def _selected_positions(self) -> List[Dict[str, Any]]:
+        """Return the positions of all selected table rows."""
+        return [
+            self.positions_model.position(self.positions_proxy.mapToSource(index).row())
+            for index in self.positions_table.selectionModel().selectedRows()
+        ]
     
     def refresh_data(self):
-        """Refresh all data (positions, portfolio, and performance)."""
-        self.refresh_positions()
-        self.refresh_portfolio()
-        self.refresh_performance()
-        self.data_updated.emit()
-        logger.info("Refreshed all Open Positions data")
+        """
+        Refresh all data (positions, portfolio, and performance).
+        
+        One snapshot is loaded on a background thread - a single live price
+        fetch from which every figure is derived - and applied to all three
+        views when it arrives; data_updated is emitted once it has been.
+        """
+        if not self.open_positions:
+            self.refresh_portfolio()
+            self.refresh_performance()
+            self.data_updated.emit()
+        else:
+            self._request_snapshot()
+        
+        logger.info("Queued refresh of all Open Positions data")
+    
+    def _request_snapshot(self):
+        """Load a positions snapshot off the GUI thread."""
+        if self._snapshot_thread is not None:
+            # Run once more after the in-flight load so no change is missed
+            self._snapshot_again = True
+            return
+        
+        self.status_label.setText("Fetching live prices...")
+        
+        thread = TaskThread('snapshot', self.open_positions.snapshot, parent=self)
+        thread.result_ready.connect(self._on_snapshot)
+        thread.error_occurred.connect(self._on_snapshot_error)
+        self._snapshot_thread = thread
+        thread.start()
+    
+    def _on_snapshot(self, name: str, snapshot: PositionsSnapshot):
+        """Apply a snapshot delivered by the background load to all three views."""
+        # Always release the load, or every later refresh would only be queued
+        try:
+            self._latest_snapshot = snapshot
+            self._apply_positions(snapshot.positions)
+            self._apply_portfolio(snapshot.portfolio_pnl, snapshot.positions_summary)
+            self._apply_performance(snapshot.top_performers, snapshot.portfolio_pnl)
+            self.data_updated.emit()
+        finally:
+            self._finish_snapshot()
+    
+    def _on_snapshot_error(self, name: str, error_msg: str):
+        """Report a failed background snapshot load."""
+        error_msg = f"Failed to refresh positions: {error_msg}"
+        self.status_label.setText(error_msg)
+        QMessageBox.critical(self, "Error", error_msg)
+        logger.error(error_msg)
+        self._finish_snapshot()
+    
+    def _finish_snapshot(self):
+        """Release the completed load and start a queued one, if any."""
+        self._snapshot_thread = None
+        if self._snapshot_again:
+            self._snapshot_again = False
+            self._request_snapshot()
     
     def closeEvent(self, event):
         """Handle close event to stop auto-refresh timer."""
@@ -645,12 +1393,13 @@ TOP PERFORMERS (by P&L %):
     
     def _on_position_selection_changed(self):
         """Handle position selection change in table."""
-        selected_rows = self.positions_table.selectionModel().selectedRows()
-        has_selection = len(selected_rows) > 0
+        has_selection = self.positions_table.selectionModel().hasSelection()
         
-        # Enable/disable edit and delete buttons based on selection
-        self.edit_position_btn.setEnabled(has_selection)
-        self.delete_position_btn.setEnabled(has_selection)
+        # Enable/disable edit and delete buttons based on selection; both
+        # stay off while a previous edit or delete is still being written
+        can_change = has_selection and self._write_thread is None
+        self.edit_position_btn.setEnabled(can_change)
+        self.delete_position_btn.setEnabled(can_change)
     
     def _add_position(self):
         """Show dialog to add a new position."""
@@ -658,7 +1407,12 @@ TOP PERFORMERS (by P&L %):
             QMessageBox.warning(self, "Error", "Open Positions service not available")
             return
         
-        dialog = AddPositionDialog(self)
+        # One dialog is built on first use and cleared for each later one
+        if self._add_dialog is None:
+            self._add_dialog = AddPositionDialog(self)
+        else:
+            self._add_dialog.reset_form()
+        dialog = self._add_dialog
         if dialog.exec() == QDialog.Accepted:
             position_data = dialog.get_position_data()
             
@@ -672,7 +1426,7 @@ TOP PERFORMERS (by P&L %):
                 )
                 
                 QMessageBox.information(self, "Success", f"Position added successfully (ID: {position_id})")
-                self.refresh_positions()
+                self.refresh_positions(force=True)
                 
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to add position: {str(e)}")
@@ -683,14 +1437,13 @@ TOP PERFORMERS (by P&L %):
             QMessageBox.warning(self, "Error", "Open Positions service not available")
             return
         
-        selected_rows = self.positions_table.selectionModel().selectedRows()
-        if not selected_rows:
+        selected_position = self._selected_position()
+        if selected_position is None:
             QMessageBox.warning(self, "Warning", "Please select a position to edit")
             return
         
         # Get position ID from the selected row
-        row = selected_rows[0].row()
-        position_id = int(self.positions_table.item(row, 0).text())
+        position_id = selected_position['id']
         
         # Get current position data
         try:
@@ -699,69 +1452,152 @@ TOP PERFORMERS (by P&L %):
                 QMessageBox.warning(self, "Error", "Position not found")
                 return
             
-            dialog = EditPositionDialog(position, self)
+            # One dialog is built on first use and reloaded for each later edit
+            if self._edit_dialog is None:
+                self._edit_dialog = EditPositionDialog(position, self)
+            else:
+                self._edit_dialog.load_position(position)
+            dialog = self._edit_dialog
             if dialog.exec() == QDialog.Accepted:
                 position_data = dialog.get_position_data()
-                
-                success = self.open_positions.update_position(
-                    position_id=position_id,
-                    symbol=position_data['symbol'],
-                    asset_type=position_data['asset_type'],
-                    entry_date=position_data['entry_date'],
-                    entry_price=position_data['entry_price'],
-                    quantity=position_data['quantity']
-                )
-                
-                if success:
-                    QMessageBox.information(self, "Success", "Position updated successfully")
-                    self.refresh_positions()
-                else:
-                    QMessageBox.warning(self, "Warning", "Position update failed")
+                self.status_label.setText(f"Updating position {position_data['symbol']}...")
+                self._start_position_write('update_position', self._write_position_update,
+                                           position_id, position_data)
                     
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to edit position: {str(e)}")
     
+    def _write_position_update(self, position_id: int, position_data: Dict[str, Any]):
+        """
+        Store an edited position (runs on a worker thread).
+        
+        Returns:
+            tuple or None: (position as stored, positions fingerprint), None if
+            the update failed
+        """
+        if not self.open_positions.update_position(position_id=position_id, **position_data):
+            return None
+        return self.open_positions.get_position(position_id), self.open_positions.positions_version()
+    
+    def _write_position_deletion(self, position_ids: List[int], symbols: str):
+        """
+        Delete positions (runs on a worker thread).
+        
+        Returns:
+            tuple: (number deleted, position ids, symbols, positions fingerprint)
+        """
+        deleted = self.open_positions.delete_positions(position_ids)
+        return deleted, position_ids, symbols, self.open_positions.positions_version()
+    
+    def _start_position_write(self, name: str, func, *args):
+        """Run a position update or delete on a background thread."""
+        thread = TaskThread(name, func, *args, parent=self)
+        thread.result_ready.connect(self._on_position_written)
+        thread.error_occurred.connect(self._on_position_write_error)
+        self._write_thread = thread
+        self._on_position_selection_changed()
+        thread.start()
+    
+    def _on_position_written(self, name: str, result):
+        """Report a finished background update or delete and show its effect."""
+        self._finish_position_write()
+        
+        if name == 'update_position':
+            if result is None:
+                QMessageBox.warning(self, "Warning", "Position update failed")
+                return
+            position, version = result
+            QMessageBox.information(self, "Success", "Position updated successfully")
+            self._replace_position(position, version)
+        else:
+            deleted, position_ids, symbols, version = result
+            if not deleted:
+                QMessageBox.warning(self, "Warning", "Position deletion failed")
+                return
+            QMessageBox.information(self, "Success", f"Deleted {deleted} position(s): {symbols}")
+            self._remove_positions(position_ids, version)
+    
+    def _on_position_write_error(self, name: str, error_msg: str):
+        """Report a failed background update or delete."""
+        self._finish_position_write()
+        action = "edit" if name == 'update_position' else "delete"
+        self.status_label.setText(f"Failed to {action} position")
+        QMessageBox.critical(self, "Error", f"Failed to {action} position: {error_msg}")
+    
+    def _finish_position_write(self):
+        """Release the completed write and re-enable the edit/delete buttons."""
+        self._write_thread = None
+        self._on_position_selection_changed()
+    
+    def _replace_position(self, position: Dict[str, Any], version: tuple):
+        """Show an edited position in place, without reloading the table."""
+        old_position = next((p for p in self.positions_data if p['id'] == position['id']), None)
+        self.positions_data = [position if p['id'] == position['id'] else p for p in self.positions_data]
+        if not self.positions_model.replace_position(position):
+            self.refresh_positions(force=True)
+            return
+        self._positions_version = version
+        self.status_label.setText(f"Updated position {position['symbol']}")
+        
+        # The stored row has no live figures; re-derive them (recent quotes are cached)
+        if old_position is not None and old_position.get('live_price') is not None:
+            self.refresh_live_data()
+    
+    def _remove_positions(self, position_ids: List[int], version: tuple):
+        """Drop deleted positions from the table, without reloading it."""
+        removed = set(position_ids)
+        self.positions_data = [p for p in self.positions_data if p['id'] not in removed]
+        self.positions_model.remove_positions(removed)
+        self._positions_version = version
+        self.status_label.setText(f"Loaded {len(self.positions_data)} positions")
+    
     def _delete_position(self):
-        """Delete the selected position."""
+        """Delete the selected positions."""
         if not self.open_positions:
             QMessageBox.warning(self, "Error", "Open Positions service not available")
             return
         
-        selected_rows = self.positions_table.selectionModel().selectedRows()
-        if not selected_rows:
+        selected_positions = self._selected_positions()
+        if not selected_positions:
             QMessageBox.warning(self, "Warning", "Please select a position to delete")
             return
         
-        # Get position info from the selected row
-        row = selected_rows[0].row()
-        position_id = int(self.positions_table.item(row, 0).text())
-        symbol = self.positions_table.item(row, 1).text()
+        # Get position info from the selected rows
+        position_ids = [position['id'] for position in selected_positions]
+        symbols = ", ".join(position['symbol'] for position in selected_positions)
+        if len(selected_positions) == 1:
+            description = f"the position for {symbols}"
+        else:
+            description = f"{len(selected_positions)} positions ({symbols})"
         
         # Confirm deletion
         reply = QMessageBox.question(
             self, "Confirm Deletion",
-            f"Are you sure you want to delete the position for {symbol}?\n\n"
+            f"Are you sure you want to delete {description}?\n\n"
             f"This action cannot be undone.",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                success = self.open_positions.delete_position(position_id)
-                
-                if success:
-                    QMessageBox.information(self, "Success", f"Position {symbol} deleted successfully")
-                    self.refresh_positions()
-                else:
-                    QMessageBox.warning(self, "Warning", "Position deletion failed")
-                    
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to delete position: {str(e)}")
+            # One transaction for the whole selection, written in the background
+            self.status_label.setText(f"Deleting {description}...")
+            self._start_position_write('delete_positions', self._write_position_deletion,
+                                       position_ids, symbols)
 
 
 # ==================== DIALOG CLASSES ====================
 
+def _center_on_parent(dialog: QDialog):
+    """Move a dialog so it is centered over its parent widget on screen."""
+    parent = dialog.parentWidget()
+    if parent is None:
+        return
+    geometry = dialog.frameGeometry()
+    geometry.moveCenter(parent.mapToGlobal(parent.rect().center()))
+    dialog.move(geometry.topLeft())
+
+
 class AddPositionDialog(QDialog):
     """Dialog for adding a new position."""
     
@@ -771,14 +1607,16 @@ class AddPositionDialog(QDialog):
         self.setModal(True)
         self.resize(450, 350)
         
-        # Center the dialog on parent
-        if parent:
-            parent_rect = parent.geometry()
-            x = parent_rect.x() + (parent_rect.width() - 450) // 2
-            y = parent_rect.y() + (parent_rect.height() - 350) // 2
-            self.move(x, y)
+        # Form values read and validated by accept()
+        self._accepted_data = None
         
         self._setup_ui()
+        self.reset_form()
+    
+    def showEvent(self, event):
+        """Center over the parent each time the dialog is shown, once laid out."""
+        _center_on_parent(self)
+        super().showEvent(event)
     
     def _setup_ui(self):
         """Set up the dialog UI."""
@@ -794,12 +1632,11 @@ class AddPositionDialog(QDialog):
         
         # Asset Type
         self.asset_type_combo = QComboBox()
-        self.asset_type_combo.addItems(["stock", "crypto", "etf", "forex", "commodity", "bond", "option", "future"])
+        self.asset_type_combo.addItems(ASSET_TYPES)
         form_layout.addRow("Asset Type:", self.asset_type_combo)
         
         # Entry Date
         self.entry_date_edit = QDateEdit()
-        self.entry_date_edit.setDate(datetime.now().date())
         self.entry_date_edit.setCalendarPopup(True)
         form_layout.addRow("Entry Date:", self.entry_date_edit)
         
@@ -807,14 +1644,12 @@ class AddPositionDialog(QDialog):
         self.entry_price_spin = QDoubleSpinBox()
         self.entry_price_spin.setRange(0.01, 999999.99)
         self.entry_price_spin.setDecimals(2)
-        self.entry_price_spin.setValue(100.00)
         form_layout.addRow("Entry Price:", self.entry_price_spin)
         
         # Quantity
         self.quantity_spin = QDoubleSpinBox()
         self.quantity_spin.setRange(0.01, 999999.99)
         self.quantity_spin.setDecimals(4)
-        self.quantity_spin.setValue(1.0)
         form_layout.addRow("Quantity:", self.quantity_spin)
         
         layout.addLayout(form_layout)
@@ -832,8 +1667,24 @@ class AddPositionDialog(QDialog):
         
         layout.addLayout(button_layout)
     
+    def reset_form(self):
+        """Clear the form to its defaults, ready for another position."""
+        self._accepted_data = None
+        self.symbol_edit.clear()
+        self.asset_type_combo.setCurrentIndex(0)
+        self.entry_date_edit.setDate(QDate.currentDate())
+        self.entry_price_spin.setValue(100.00)
+        self.quantity_spin.setValue(1.0)
+        self.symbol_edit.setFocus()
+    
     def get_position_data(self):
-        """Get the position data from the form."""
+        """Get the position data from the form (as validated on accept)."""
+        if self._accepted_data is not None:
+            return self._accepted_data
+        return self._read_form()
+    
+    def _read_form(self):
+        """Read the position data from the form widgets."""
         return {
             'symbol': self.symbol_edit.text().strip().upper(),
             'asset_type': self.asset_type_combo.currentText(),
@@ -844,18 +1695,22 @@ class AddPositionDialog(QDialog):
     
     def accept(self):
         """Validate and accept the dialog."""
-        if not self.symbol_edit.text().strip():
+        # Read the form once; the validated values are what get_position_data returns
+        data = self._read_form()
+        
+        if not data['symbol']:
             QMessageBox.warning(self, "Validation Error", "Please enter a symbol")
             return
         
-        if self.entry_price_spin.value() <= 0:
+        if data['entry_price'] <= 0:
             QMessageBox.warning(self, "Validation Error", "Entry price must be greater than 0")
             return
         
-        if self.quantity_spin.value() <= 0:
+        if data['quantity'] <= 0:
             QMessageBox.warning(self, "Validation Error", "Quantity must be greater than 0")
             return
         
+        self._accepted_data = data
         super().accept()
 
 
@@ -864,20 +1719,19 @@ class EditPositionDialog(QDialog):
     
     def __init__(self, position_data, parent=None):
         super().__init__(parent)
-        self.position_data = position_data
-        self.setWindowTitle(f"Edit Position - {position_data['symbol']}")
         self.setModal(True)
         self.resize(450, 350)
         
-        # Center the dialog on parent
-        if parent:
-            parent_rect = parent.geometry()
-            x = parent_rect.x() + (parent_rect.width() - 450) // 2
-            y = parent_rect.y() + (parent_rect.height() - 350) // 2
-            self.move(x, y)
+        # Form values read and validated by accept()
+        self._accepted_data = None
         
         self._setup_ui()
-        self._populate_form()
+        self.load_position(position_data)
+    
+    def showEvent(self, event):
+        """Center over the parent each time the dialog is shown, once laid out."""
+        _center_on_parent(self)
+        super().showEvent(event)
     
     def _setup_ui(self):
         """Set up the dialog UI."""
@@ -892,7 +1746,7 @@ class EditPositionDialog(QDialog):
         
         # Asset Type
         self.asset_type_combo = QComboBox()
-        self.asset_type_combo.addItems(["stock", "crypto", "etf", "forex", "commodity", "bond", "option", "future"])
+        self.asset_type_combo.addItems(ASSET_TYPES)
         form_layout.addRow("Asset Type:", self.asset_type_combo)
         
         # Entry Date
@@ -927,25 +1781,37 @@ class EditPositionDialog(QDialog):
         
         layout.addLayout(button_layout)
     
+    def load_position(self, position_data):
+        """Show another position in the dialog, so one instance can be reused."""
+        self.position_data = position_data
+        self._accepted_data = None
+        self.setWindowTitle(f"Edit Position - {position_data['symbol']}")
+        self._populate_form()
+    
     def _populate_form(self):
         """Populate the form with existing position data."""
         self.symbol_edit.setText(self.position_data['symbol'])
         
-        # Set asset type
-        index = self.asset_type_combo.findText(self.position_data['asset_type'])
+        # Set asset type (combo items are ASSET_TYPES, in order)
+        index = _ASSET_TYPE_INDEX.get(self.position_data['asset_type'], -1)
         if index >= 0:
             self.asset_type_combo.setCurrentIndex(index)
         
         # Set entry date
-        entry_date = datetime.strptime(self.position_data['entry_date'], '%Y-%m-%d').date()
-        self.entry_date_edit.setDate(entry_date)
+        self.entry_date_edit.setDate(QDate.fromString(self.position_data['entry_date'], 'yyyy-MM-dd'))
         
         # Set entry price and quantity
         self.entry_price_spin.setValue(float(self.position_data['entry_price']))
         self.quantity_spin.setValue(float(self.position_data['quantity']))
     
     def get_position_data(self):
-        """Get the updated position data from the form."""
+        """Get the updated position data from the form (as validated on accept)."""
+        if self._accepted_data is not None:
+            return self._accepted_data
+        return self._read_form()
+    
+    def _read_form(self):
+        """Read the position data from the form widgets."""
         return {
             'symbol': self.symbol_edit.text().strip().upper(),
             'asset_type': self.asset_type_combo.currentText(),
@@ -956,16 +1822,20 @@ class EditPositionDialog(QDialog):
     
     def accept(self):
         """Validate and accept the dialog."""
-        if not self.symbol_edit.text().strip():
+        # Read the form once; the validated values are what get_position_data returns
+        data = self._read_form()
+        
+        if not data['symbol']:
             QMessageBox.warning(self, "Validation Error", "Please enter a symbol")
             return
         
-        if self.entry_price_spin.value() <= 0:
+        if data['entry_price'] <= 0:
             QMessageBox.warning(self, "Validation Error", "Entry price must be greater than 0")
             return
         
-        if self.quantity_spin.value() <= 0:
+        if data['quantity'] <= 0:
             QMessageBox.warning(self, "Validation Error", "Quantity must be greater than 0")
             return
         
+        self._accepted_data = data
         super().accept() 
\ No newline at end of file
@@ -23,6 +23,8 @@ from typing import Optional, Dict, Any, List
 from trading import TradingJournal, TradingJournalError
 from db import AlphaDatabase
 
+from .workers import TaskThread
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -187,6 +189,10 @@ class TradingPage(QWidget):
         # Data storage for tables
         self.trades_data = []
         
+        # In-flight background load, and whether another was requested meanwhile
+        self._refresh_thread: Optional[TaskThread] = None
+        self._refresh_again = False
+        
         self._setup_ui()
         
         # Load initial data if business logic is available
@@ -606,11 +612,16 @@ class TradingPage(QWidget):
             return
         
         try:
-            # Get trade summary
-            summary = self.trading_journal.get_trade_summary()
-            
-            # Format analysis text
-            analysis_text = f"""TRADING ANALYSIS
+            self._show_analysis(self.trading_journal.get_trade_summary())
+        except Exception as e:
+            error_text = f"Error loading trading analysis: {str(e)}"
+            self.analysis_content.setText(error_text)
+            logger.error(f"Failed to refresh analysis: {e}")
+    
+    def _show_analysis(self, summary: Dict[str, Any]):
+        """Display the trading analysis for a trade summary."""
+        # Format analysis text
+        analysis_text = f"""TRADING ANALYSIS
 ============================================
 
 TRADE SUMMARY:
@@ -620,30 +631,25 @@ TRADE SUMMARY:
 
 ASSET TYPE BREAKDOWN:
 """
-            
-            asset_breakdown = summary.get('asset_type_breakdown', {})
-            for asset_type, count in asset_breakdown.items():
-                percentage = (count / summary.get('total_trades', 1) * 100)
-                analysis_text += f"• {asset_type.upper():<12}: {count:>3} trades ({percentage:>5.1f}%)\n"
-            
-            analysis_text += "\nTRADE TYPE BREAKDOWN:\n"
-            trade_breakdown = summary.get('trade_type_breakdown', {})
-            for trade_type, count in trade_breakdown.items():
-                percentage = (count / summary.get('total_trades', 1) * 100)
-                analysis_text += f"• {trade_type.upper():<12}: {count:>3} trades ({percentage:>5.1f}%)\n"
-            
-            analysis_text += "\nTOP SYMBOLS BY VOLUME:\n"
-            top_symbols = summary.get('top_symbols_by_volume', {})
-            for symbol, volume in list(top_symbols.items())[:5]:
-                analysis_text += f"• {symbol:<12}: ${volume:>12,.2f}\n"
-            
-            self.analysis_content.setText(analysis_text)
-            logger.info("Refreshed trading analysis")
-            
-        except Exception as e:
-            error_text = f"Error loading trading analysis: {str(e)}"
-            self.analysis_content.setText(error_text)
-            logger.error(f"Failed to refresh analysis: {e}")
+        
+        asset_breakdown = summary.get('asset_type_breakdown', {})
+        for asset_type, count in asset_breakdown.items():
+            percentage = (count / summary.get('total_trades', 1) * 100)
+            analysis_text += f"• {asset_type.upper():<12}: {count:>3} trades ({percentage:>5.1f}%)\n"
+        
+        analysis_text += "\nTRADE TYPE BREAKDOWN:\n"
+        trade_breakdown = summary.get('trade_type_breakdown', {})
+        for trade_type, count in trade_breakdown.items():
+            percentage = (count / summary.get('total_trades', 1) * 100)
+            analysis_text += f"• {trade_type.upper():<12}: {count:>3} trades ({percentage:>5.1f}%)\n"
+        
+        analysis_text += "\nTOP SYMBOLS BY VOLUME:\n"
+        top_symbols = summary.get('top_symbols_by_volume', {})
+        for symbol, volume in list(top_symbols.items())[:5]:
+            analysis_text += f"• {symbol:<12}: ${volume:>12,.2f}\n"
+        
+        self.analysis_content.setText(analysis_text)
+        logger.info("Refreshed trading analysis")
     
     def refresh_performance(self):
         """Refresh the performance metrics."""
@@ -652,18 +658,23 @@ ASSET TYPE BREAKDOWN:
             return
         
         try:
-            # Get trade summary for performance metrics
+            # Get trade summary and trades for performance metrics
             summary = self.trading_journal.get_trade_summary()
-            
-            # Calculate additional performance metrics
             trades = self.trading_journal.get_all_trades()
-            
-            # Calculate total value by trade type
-            buy_volume = sum(t['entry_price'] * t['quantity'] for t in trades if t['trade_type'] == 'buy')
-            sell_volume = sum(t['entry_price'] * t['quantity'] for t in trades if t['trade_type'] == 'sell')
-            
-            # Format performance text
-            performance_text = f"""PERFORMANCE METRICS
+            self._show_performance(summary, trades)
+        except Exception as e:
+            error_text = f"Error loading performance metrics: {str(e)}"
+            self.performance_content.setText(error_text)
+            logger.error(f"Failed to refresh performance: {e}")
+    
+    def _show_performance(self, summary: Dict[str, Any], trades: List[Dict[str, Any]]):
+        """Display performance metrics for a trade summary and trade list."""
+        # Calculate total value by trade type
+        buy_volume = sum(t['entry_price'] * t['quantity'] for t in trades if t['trade_type'] == 'buy')
+        sell_volume = sum(t['entry_price'] * t['quantity'] for t in trades if t['trade_type'] == 'sell')
+        
+        # Format performance text
+        performance_text = f"""PERFORMANCE METRICS
 ============================================
 
 VOLUME METRICS:
@@ -682,23 +693,18 @@ PORTFOLIO ACTIVITY:
 
 RECENT ACTIVITY:
 """
-            
-            # Show recent trades
-            recent_trades = trades[-3:] if trades else []
-            for trade in recent_trades:
-                value = trade['entry_price'] * trade['quantity']
-                performance_text += f"• {trade['entry_date']} | {trade['symbol']} {trade['trade_type'].upper()} | ${value:,.2f}\n"
-            
-            if not recent_trades:
-                performance_text += "• No recent trades\n"
-            
-            self.performance_content.setText(performance_text)
-            logger.info("Refreshed performance metrics")
-            
-        except Exception as e:
-            error_text = f"Error loading performance metrics: {str(e)}"
-            self.performance_content.setText(error_text)
-            logger.error(f"Failed to refresh performance: {e}")
+        
+        # Show recent trades
+        recent_trades = trades[-3:] if trades else []
+        for trade in recent_trades:
+            value = trade['entry_price'] * trade['quantity']
+            performance_text += f"• {trade['entry_date']} | {trade['symbol']} {trade['trade_type'].upper()} | ${value:,.2f}\n"
+        
+        if not recent_trades:
+            performance_text += "• No recent trades\n"
+        
+        self.performance_content.setText(performance_text)
+        logger.info("Refreshed performance metrics")
     
     def _populate_trades_table(self, trades_data: List[Dict[str, Any]]):
         """Populate the trades table with given data."""
@@ -748,9 +754,74 @@ RECENT ACTIVITY:
             self.trades_table.setItem(row, 9, QTableWidgetItem(trade.get('tags', '')))
     
     def refresh_data(self):
-        """Refresh all data (trades, analysis, and performance)."""
-        self.refresh_trades()
-        self.refresh_analysis()
-        self.refresh_performance()
-        self.data_updated.emit()
-        logger.info("Refreshed all Trading Journal data") 
\ No newline at end of file
+        """
+        Refresh all data (trades, analysis, and performance).
+        
+        Trades and the trade summary are loaded on a background thread and
+        applied to all three views when they arrive; data_updated is emitted
+        once they have been.
+        """
+        if not self.trading_journal:
+            self.refresh_analysis()
+            self.refresh_performance()
+            self.data_updated.emit()
+        elif self._refresh_thread is not None:
+            # Run once more after the in-flight load so no change is missed
+            self._refresh_again = True
+        else:
+            self._start_background_refresh()
+        
+        logger.info("Queued refresh of all Trading Journal data")
+    
+    def _start_background_refresh(self):
+        """Load trades and the trade summary off the GUI thread."""
+        thread = TaskThread('trading', self._fetch_trading_data, parent=self)
+        thread.result_ready.connect(self._on_trading_data)
+        thread.error_occurred.connect(self._on_trading_data_error)
+        self._refresh_thread = thread
+        thread.start()
+    
+    def _fetch_trading_data(self):
+        """Return (trades, summary); runs in a background thread and touches no widgets."""
+        return self.trading_journal.get_all_trades(), self.trading_journal.get_trade_summary()
+    
+    def _on_trading_data(self, name: str, data):
+        """Apply trades and summary delivered by the background load."""
+        # Always release the load, or every later refresh would only be queued
+        try:
+            trades, summary = data
+            self.trades_data = trades
+            try:
+                self._apply_filters()  # This will populate the table with current filters
+                logger.info(f"Refreshed trades table with {len(trades)} records")
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to refresh trades: {str(e)}")
+                logger.error(f"Failed to refresh trades: {e}")
+            
+            try:
+                self._show_analysis(summary)
+            except Exception as e:
+                self.analysis_content.setText(f"Error loading trading analysis: {str(e)}")
+                logger.error(f"Failed to refresh analysis: {e}")
+            try:
+                self._show_performance(summary, trades)
+            except Exception as e:
+                self.performance_content.setText(f"Error loading performance metrics: {str(e)}")
+                logger.error(f"Failed to refresh performance: {e}")
+            
+            self.data_updated.emit()
+        finally:
+            self._finish_background_refresh()
+    
+    def _on_trading_data_error(self, name: str, error_msg: str):
+        """Report a failed background load."""
+        QMessageBox.critical(self, "Error", f"Failed to refresh trades: {error_msg}")
+        logger.error(f"Failed to refresh trades: {error_msg}")
+        self._finish_background_refresh()
+    
+    def _finish_background_refresh(self):
+        """Release the completed load and start a queued one, if any."""
+        self._refresh_thread = None
+        if self._refresh_again:
+            self._refresh_again = False
+            self._start_background_refresh() 
\ No newline at end of file
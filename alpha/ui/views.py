@@ -0,0 +1,89 @@
+"""
+views.py
+
+Shared view widgets and helpers for the Alpha application UI.
+Used by several pages so the same display logic lives in one place.
+"""
+
+from PySide6.QtWidgets import QPlainTextEdit, QFrame, QAbstractItemView
+from PySide6.QtGui import QFont, QColor, QPalette, QTextCursor
+from contextlib import contextmanager
+from typing import List, Optional
+
+
+@contextmanager
+def frozen(view: QAbstractItemView):
+    """
+    Suspend painting of an item view while its contents are rebuilt.
+    
+    The view is repainted once when the block exits instead of after
+    every intermediate change (model reset, column resizes).
+    """
+    view.setUpdatesEnabled(False)
+    try:
+        yield view
+    finally:
+        view.setUpdatesEnabled(True)
+        view.viewport().update()
+
+
+class ReportView(QPlainTextEdit):
+    """
+    Read-only monospace view for a preformatted text report.
+    
+    When a refresh keeps the line count (the usual case: same rows, new
+    figures) only the changed lines are replaced, each in its own text
+    block, so only those blocks are laid out again.
+    """
+    
+    def __init__(self, text: str, parent=None):
+        """
+        Initialize the view.
+        
+        Args:
+            text: Initial report text
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.setReadOnly(True)
+        
+        # Reports are preformatted monospace text: no wrap points to compute
+        self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        
+        # Styled through palette, font and frame rather than a style sheet
+        font = QFont("monospace")
+        font.setStyleHint(QFont.StyleHint.TypeWriter)
+        font.setPixelSize(12)
+        self.setFont(font)
+        self.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Plain)
+        self.setLineWidth(1)
+        self.document().setDocumentMargin(20)
+        palette = self.palette()
+        palette.setColor(QPalette.ColorRole.Base, QColor("#f8f9fa"))
+        palette.setColor(QPalette.ColorRole.Text, QColor("#212529"))
+        self.setPalette(palette)
+        
+        self._lines: Optional[List[str]] = None
+        self.set_report_text(text)
+    
+    def set_report_text(self, text: str):
+        """Show report text, rewriting only the lines that differ."""
+        lines = text.split('\n')
+        previous = self._lines
+        self._lines = lines
+        
+        if previous is None or len(previous) != len(lines):
+            self.setPlainText(text)
+            return
+        
+        document = self.document()
+        cursor = QTextCursor(document)
+        cursor.beginEditBlock()
+        for number, (old_line, new_line) in enumerate(zip(previous, lines)):
+            if old_line != new_line:
+                block = document.findBlockByNumber(number)
+                cursor.setPosition(block.position())
+                cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock,
+                                    QTextCursor.MoveMode.KeepAnchor)
+                cursor.insertText(new_line)
+        cursor.endEditBlock()
@@ -0,0 +1,56 @@
+"""
+workers.py
+
+Background worker threads for the Alpha application UI.
+Runs blocking business-logic calls (database queries, market data fetches)
+off the GUI thread and delivers the results back through Qt signals.
+"""
+
+from PySide6.QtCore import QThread, Signal
+import logging
+from typing import Any, Callable
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class TaskThread(QThread):
+    """
+    Thread for running a blocking backend call without blocking the UI.
+    
+    The task name is emitted with every result so one slot can serve
+    several kinds of task. Signals are delivered to the receiver's thread,
+    so connected slots may safely update widgets.
+    """
+    
+    result_ready = Signal(str, object)  # Emits (task name, return value)
+    error_occurred = Signal(str, str)   # Emits (task name, error message)
+    
+    def __init__(self, name: str, func: Callable[..., Any], *args, parent=None, **kwargs):
+        """
+        Initialize the task thread.
+        
+        Args:
+            name: Identifier passed back with the result or error
+            func: Callable to run in the background thread
+            *args: Positional arguments for func
+            parent: Owning QObject; keeps the thread alive while it runs
+            **kwargs: Keyword arguments for func
+        """
+        super().__init__(parent)
+        self.name = name
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        
+        # Release the thread object once it has finished running
+        self.finished.connect(self.deleteLater)
+    
+    def run(self):
+        """Run the task in a separate thread."""
+        try:
+            result = self.func(*self.args, **self.kwargs)
+            self.result_ready.emit(self.name, result)
+        except Exception as e:
+            logger.error(f"Background task '{self.name}' failed: {e}")
+            self.error_occurred.emit(self.name, str(e))